@@ -1,5 +1,6 @@
 import glm
 import math
+import numpy as np
 
 class Frustum:
     """Camera frustum for culling objects outside the view"""
@@ -131,6 +132,25 @@ class Frustum:
         
         return self.is_aabb_inside(min_point, max_point)
     
+    def chunks_visible_mask(self, chunk_xs, chunk_zs, chunk_size=16, chunk_height=256):
+        """Vectorized is_chunk_visible: boolean mask for arrays of chunk coordinates"""
+        world_x = np.asarray(chunk_xs, dtype=np.float64) * chunk_size
+        world_z = np.asarray(chunk_zs, dtype=np.float64) * chunk_size
+        visible = np.ones(world_x.shape, dtype=bool)
+        
+        for plane in self.planes:
+            # Positive vertex offsets are the same for every chunk, so each plane is
+            # one multiply-add over all chunks (same test as is_aabb_inside)
+            offset_x = chunk_size if plane.x >= 0 else 0
+            offset_y = chunk_height if plane.y >= 0 else 0
+            offset_z = chunk_size if plane.z >= 0 else 0
+            distance = (plane.x * (world_x + offset_x) +
+                        plane.z * (world_z + offset_z) +
+                        (plane.y * offset_y + plane.w))
+            visible &= distance >= 0
+        
+        return visible
+    
     def get_visible_chunks(self, chunk_list):
         """Filter a list of chunks to only include visible ones"""
         visible_chunks = []
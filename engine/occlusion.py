@@ -250,16 +250,17 @@ class OcclusionCuller:
         
         # Find potential occluder chunks (closer to camera)
         occluder_chunks = []
+        # Compare squared distances - no sqrt per candidate
+        max_occluder_sq = min(target_distance * 0.8, self.max_occlusion_distance * self.chunk_size) ** 2
         
         for chunk_coords in all_chunks:
             if chunk_coords == target_chunk:
                 continue
             
-            chunk_distance = self.distance_to_chunk(camera_pos, chunk_coords[0], chunk_coords[1])
+            chunk_center = self.get_chunk_center(chunk_coords[0], chunk_coords[1])
             
             # Only consider chunks that are significantly closer
-            if (chunk_distance < target_distance * 0.8 and 
-                chunk_distance < self.max_occlusion_distance * self.chunk_size):
+            if glm.length2(camera_pos - chunk_center) < max_occluder_sq:
                 occluder_chunks.append(chunk_coords)
         
         # Need minimum number of potential occluders
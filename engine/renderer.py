@@ -7,6 +7,79 @@ from engine.sky import SkyRenderer
 import glm
 import math
 
+# Floats per chunk vertex: 3f position, 3f tex_coord (vec3), 1f shading
+CHUNK_VERTEX_STRIDE = 7
+
+# Most chunk meshes uploaded per flush_uploads call; the rest wait for the next frame
+MAX_UPLOADS_PER_FLUSH = 24
+
+
+class MeshBatch:
+    """Shared vertex/index buffers holding the meshes of several chunks
+    
+    The buffers can only be freed as a whole, so ranges of chunks that were
+    rebuilt or unloaded stay allocated while others are still drawn. Once
+    fewer than half of the ranges are live, the survivors are queued for
+    re-upload (into a fresh batch) so this one can be freed. That keeps the
+    GPU memory of every batch under 2x its live mesh data, instead of up to
+    MAX_UPLOADS_PER_FLUSH x when chunks in it are rebuilt one at a time.
+    """
+    
+    def __init__(self, renderer, vao, buffers):
+        self.renderer = renderer
+        self.vao = vao
+        self.buffers = buffers
+        self.meshes = set()  # Live BatchedMesh ranges
+        self.size = 0  # Number of ranges the batch was created with
+        self.compacting = False
+    
+    def add(self, mesh):
+        self.meshes.add(mesh)
+        self.size += 1
+    
+    def release_ref(self, mesh):
+        """Drop one user; free the GPU objects once nobody draws from them"""
+        self.meshes.discard(mesh)
+        if not self.meshes:
+            if self.vao:
+                self.vao.release()
+                for buffer in self.buffers:
+                    buffer.release()
+                self.vao = None
+                self.buffers = []
+        elif not self.compacting and len(self.meshes) * 2 < self.size:
+            # Mostly dead - the next flush moves the remaining chunks out so the buffers can go
+            self.compacting = True
+            self.renderer.batches_to_compact.append(self)
+    
+    def requeue_live(self):
+        """Queue the meshes still drawn from this batch for re-upload"""
+        for live in self.meshes:
+            self.renderer.requeue_upload(live.owner, live.vertices, live.indices)
+
+
+class BatchedMesh:
+    """Draw range of one chunk inside a MeshBatch (used like a VAO)"""
+    
+    def __init__(self, batch, owner, vertices, indices, first):
+        self.batch = batch
+        self.owner = owner
+        # Source mesh (the owner's own cached arrays) for re-uploading on compaction
+        self.vertices = vertices
+        self.indices = indices
+        self.first = first  # Offset into the shared index buffer
+        self.count = len(indices)  # Number of indices to draw
+        self.released = False
+    
+    def render(self):
+        self.batch.vao.render(vertices=self.count, first=self.first)
+    
+    def release(self):
+        if not self.released:
+            self.released = True
+            self.vertices = self.indices = None
+            self.batch.release_ref(self)
+
 
 class ModernGLRenderer:
     def __init__(self, width=800, height=600):
@@ -48,6 +121,10 @@ class ModernGLRenderer:
         self.block_texture = None
         self.water_texture = None
         
+        # Chunk meshes waiting to be uploaded in one batch (owner -> (vertices, indices))
+        self.pending_uploads = {}
+        self.batches_to_compact = []  # MeshBatches whose live chunks move out on the next flush
+        
         # Initialize water surface
         self.water_surface = WaterSurface(self)
         
@@ -136,6 +213,75 @@ class ModernGLRenderer:
         
         return vao
     
+    def queue_upload(self, owner, vertices, indices):
+        """Queue a chunk mesh for the next flush_uploads call
+        
+        owner must provide attach_vao(vao, vertex_count). Queuing again for
+        the same owner before a flush replaces the older mesh.
+        """
+        self.pending_uploads[owner] = (vertices, indices)
+    
+    def requeue_upload(self, owner, vertices, indices):
+        """Queue an already uploaded mesh again (MeshBatch compaction), unless a newer one is queued"""
+        if owner not in self.pending_uploads:
+            self.pending_uploads[owner] = (vertices, indices)
+    
+    def cancel_upload(self, owner):
+        """Drop a queued mesh, e.g. when its chunk is unloaded before the flush"""
+        self.pending_uploads.pop(owner, None)
+    
+    def flush_uploads(self):
+        """Upload queued chunk meshes (up to MAX_UPLOADS_PER_FLUSH) into one shared VBO/IBO pair
+        
+        Each owner gets a BatchedMesh that draws its own index range, so N
+        chunk rebuilds cost one buffer upload instead of N.
+        """
+        # Batches that became mostly dead since the last flush hand their live chunks over
+        if self.batches_to_compact:
+            for batch in self.batches_to_compact:
+                batch.requeue_live()
+            self.batches_to_compact = []
+        
+        if not self.pending_uploads:
+            return 0
+        
+        # Oldest first; anything over the per-frame budget stays queued
+        queued = list(self.pending_uploads.items())
+        self.pending_uploads = dict(queued[MAX_UPLOADS_PER_FLUSH:])
+        pending = [(owner, vertices, indices)
+                   for owner, (vertices, indices) in queued[:MAX_UPLOADS_PER_FLUSH]
+                   if len(vertices) > 0]
+        if not pending:
+            return 0
+        
+        all_vertices = np.concatenate([vertices for _, vertices, _ in pending]).astype(np.float32, copy=False)
+        
+        # Rebase each chunk's indices onto its position in the shared vertex buffer
+        index_parts = []
+        ranges = []
+        base_vertex = 0
+        first_index = 0
+        for owner, vertices, indices in pending:
+            index_parts.append(indices.astype(np.uint32) + base_vertex)
+            ranges.append((owner, vertices, indices, first_index))
+            base_vertex += len(vertices) // CHUNK_VERTEX_STRIDE
+            first_index += len(indices)
+        all_indices = np.concatenate(index_parts)
+        
+        vbo = self.ctx.buffer(all_vertices.tobytes())
+        ibo = self.ctx.buffer(all_indices.tobytes())
+        vao = self.ctx.vertex_array(self.chunk_program, [(vbo, '3f 3f 1f', 'in_position', 'in_tex_coord', 'in_shading')], ibo)
+        batch = MeshBatch(self, vao, [vbo, ibo])
+        
+        meshes = [BatchedMesh(batch, owner, vertices, indices, first)
+                  for owner, vertices, indices, first in ranges]
+        for mesh in meshes:
+            batch.add(mesh)
+        for mesh in meshes:
+            mesh.owner.attach_vao(mesh, mesh.count)
+        
+        return len(ranges)
+    
     def render_vao(self, vao):
         """Render a Vertex Array Object"""
         if vao and self.chunk_program:
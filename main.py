@@ -4,7 +4,7 @@ import time
 from engine.renderer import ModernGLRenderer
 from engine.camera import Camera
 from world.modern_chunk import ModernChunk, CHUNK_SIZE, CHUNK_HEIGHT, AIR, GRASS, DIRT, STONE, SAND, SNOW, LEAVES, WOOD, WATER
-from world.threaded_chunk_manager import ThreadedChunkManager
+from world.threaded_chunk_manager import ThreadedChunkManager, chunk_key
 import glm
 import math
 
@@ -87,7 +87,7 @@ class MinecraftModernGL:
         requested_count = 0
         
         for chunk_x, chunk_z in chunks_in_range:
-            if (chunk_x, chunk_z) not in self.chunk_manager.loaded_chunks:
+            if chunk_key(chunk_x, chunk_z) not in self.chunk_manager.chunk_states:
                 if self.chunk_manager.request_chunk_load(chunk_x, chunk_z):
                     requested_count += 1
         
@@ -308,6 +308,9 @@ class MinecraftModernGL:
         # Clear screen
         self.renderer.clear()
         
+        # Upload chunk meshes built since the last frame in one batch
+        self.renderer.flush_uploads()
+        
         # Bind texture
         if self.texture:
             self.renderer.bind_texture(self.texture)
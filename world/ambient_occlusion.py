@@ -101,7 +101,7 @@ def is_block_solid(blocks, x, y, z, chunk_size):
         return False  # Out of bounds blocks don't contribute to AO
     
     # Check if block is solid (not air)
-    return blocks[x, y, z] != 0  # 0 = AIR
+    return blocks[x, z, y] != 0  # 0 = AIR
 
 def calculate_face_ao(blocks, x, y, z, face, chunk_size=16):
     """
@@ -1,6 +1,5 @@
-import math
 import glm
-from world.modern_chunk import ModernChunk
+from world.modern_chunk import ModernChunk, CHUNK_SIZE
 
 class ChunkManager:
     """Manages dynamic chunk loading and unloading based on player position"""
@@ -16,7 +15,6 @@ class ChunkManager:
     
     def world_to_chunk_coords(self, world_x, world_z):
         """Convert world coordinates to chunk coordinates"""
-        from world.modern_chunk import CHUNK_SIZE
         chunk_x = int(world_x // CHUNK_SIZE)
         chunk_z = int(world_z // CHUNK_SIZE)
         return chunk_x, chunk_z
@@ -28,14 +26,16 @@ class ChunkManager:
     def get_chunks_in_range(self, center_chunk_x, center_chunk_z):
         """Get all chunk coordinates within render distance of center chunk"""
         chunks_in_range = set()
+        radius_sq = self.render_distance * self.render_distance
         
         for x in range(center_chunk_x - self.render_distance, 
                       center_chunk_x + self.render_distance + 1):
             for z in range(center_chunk_z - self.render_distance, 
                           center_chunk_z + self.render_distance + 1):
-                # Optional: Use circular render distance instead of square
-                distance = math.sqrt((x - center_chunk_x)**2 + (z - center_chunk_z)**2)
-                if distance <= self.render_distance:
+                # Circular render distance (squared, so no sqrt)
+                dx = x - center_chunk_x
+                dz = z - center_chunk_z
+                if dx*dx + dz*dz <= radius_sq:
                     chunks_in_range.add((x, z))
         
         return chunks_in_range
@@ -109,7 +109,6 @@ class ChunkManager:
         chunk = self.get_chunk(chunk_x, chunk_z)
         
         if chunk:
-            from world.modern_chunk import CHUNK_SIZE
             # Convert world coordinates to local chunk coordinates
             local_x = int(world_x - chunk_x * CHUNK_SIZE)
             local_z = int(world_z - chunk_z * CHUNK_SIZE)
@@ -123,7 +122,6 @@ class ChunkManager:
         chunk = self.get_chunk(chunk_x, chunk_z)
         
         if chunk:
-            from world.modern_chunk import CHUNK_SIZE
             # Convert world coordinates to local chunk coordinates
             local_x = int(world_x - chunk_x * CHUNK_SIZE)
             local_z = int(world_z - chunk_z * CHUNK_SIZE)
@@ -8,16 +8,16 @@ CHUNK_HEIGHT = 256
 AIR = 0
 WATER = 8
 
-@njit
+@njit(cache=True)
 def is_block_solid(blocks, x, y, z):
     """
     Check if a block is solid (not air) for AO calculation
     """
     if x < 0 or x >= CHUNK_SIZE or y < 0 or y >= CHUNK_HEIGHT or z < 0 or z >= CHUNK_SIZE:
         return False
-    return blocks[x, y, z] != AIR
+    return blocks[x, z, y] != AIR
 
-@njit
+@njit(cache=True)
 def get_optimized_ao(blocks, x, y, z, face_id):
     """
     Optimized AO calculation with reduced neighbor sampling (3 instead of 5)
@@ -81,7 +81,7 @@ def get_optimized_ao(blocks, x, y, z, face_id):
         return 0.4
     return val
 
-@njit
+@njit(cache=True)
 def get_greedy_quad(chunk_x, chunk_z, x, y, z, width, height, face_id, block_type, blocks):
     """
     Generate vertices for a greedy quad with Texture Array support
@@ -216,10 +216,12 @@ def get_greedy_quad(chunk_x, chunk_z, x, y, z, width, height, face_id, block_typ
         
     return result
 
-@njit
-def build_chunk_mesh_fast(blocks, chunk_x, chunk_z):
+@njit(nogil=True, cache=True)
+def build_chunk_mesh_fast(blocks, chunk_x, chunk_z, column_tops, column_floors):
     """
     Fast chunk mesh builder using Greedy Meshing (Texture Array version)
+    column_tops: per-column bound above which the chunk is all AIR
+    column_floors: per-column bound below which the chunk is all solid
     Returns (vertices, indices)
     """
     max_faces = 20000 
@@ -230,7 +232,13 @@ def build_chunk_mesh_fast(blocks, chunk_x, chunk_z):
     vertex_count = 0
     index_count = 0
     
-    dims = np.array([CHUNK_SIZE, CHUNK_HEIGHT, CHUNK_SIZE])
+    # Nothing above the tallest column can produce a face, so only sweep up to it
+    y_limit = min(int(column_tops.max()), CHUNK_HEIGHT)
+    dims = np.array([CHUNK_SIZE, y_limit, CHUNK_SIZE])
+    
+    # A face can only show if its neighbour is open, and nothing below a
+    # column's floor is, so faces looking into solid runs are skipped
+    min_floor = int(column_floors.min())
     
     for face_id in range(6):
         if face_id == 0 or face_id == 1:
@@ -247,13 +255,27 @@ def build_chunk_mesh_fast(blocks, chunk_x, chunk_z):
         for d in range(dims[d_axis]):
             mask.fill(0)
             
+            # Top/bottom faces whose neighbour layer is solid in every column
+            if d_axis == 1 and 0 <= d + direction < min_floor:
+                continue
+            
             for u in range(dims[u_axis]):
-                for v in range(dims[v_axis]):
+                # Side faces: start above the solid run of the neighbour column
+                v_start = 0
+                if v_axis == 1:
+                    if d_axis == 0:
+                        nx = d + direction; nz = u
+                    else:
+                        nx = u; nz = d + direction
+                    if 0 <= nx < CHUNK_SIZE and 0 <= nz < CHUNK_SIZE:
+                        v_start = min(int(column_floors[nx, nz]), dims[v_axis])
+                
+                for v in range(v_start, dims[v_axis]):
                     coords = np.zeros(3, dtype=np.int32)
                     coords[d_axis] = d; coords[u_axis] = u; coords[v_axis] = v
                     x, y, z = coords[0], coords[1], coords[2]
                     
-                    block_type = blocks[x, y, z]
+                    block_type = blocks[x, z, y]
                     
                     if block_type != AIR and block_type != WATER:
                         nx, ny, nz = x, y, z
@@ -264,7 +286,7 @@ def build_chunk_mesh_fast(blocks, chunk_x, chunk_z):
                         exposed = False
                         if nx < 0 or nx >= CHUNK_SIZE or ny < 0 or ny >= CHUNK_HEIGHT or nz < 0 or nz >= CHUNK_SIZE:
                             exposed = True
-                        elif blocks[nx, ny, nz] == AIR or blocks[nx, ny, nz] == WATER:
+                        elif blocks[nx, nz, ny] == AIR or blocks[nx, nz, ny] == WATER:
                             exposed = True
                             
                         if exposed:
@@ -5,47 +5,36 @@ import math
 # Fast Simplex Noise implementation compatible with Numba
 # Based on public domain implementations of Simplex Noise
 
-@njit
+@njit(inline='always', cache=True)
 def fast_floor(x):
     return int(x) if x >= 0 else int(x) - 1
 
-@njit
+@njit(inline='always', cache=True)
 def dot2(g, x, y):
     return g[0]*x + g[1]*y
 
-@njit
+@njit(inline='always', cache=True)
 def dot3(g, x, y, z):
     return g[0]*x + g[1]*y + g[2]*z
 
+# World seed the permutation table is built from
+NOISE_SEED = 42
+
+# Numba's disk cache (cache=True) only checks the source file of the kernel being
+# loaded, but kernels calling the functions below compile their code (and the
+# tables) into themselves. A cached kernel in another module would therefore keep
+# stale noise after any change to this file, including NOISE_SEED. So other
+# modules only call the noise from Python via the *_grid kernels, or from kernels
+# without cache=True (see terrain_generator.sample_cave_noise).
+
+def seed_noise(seed):
+    """Build a 512-entry permutation table (a shuffled 0-255, repeated) from a seed"""
+    perm = np.random.default_rng(seed).permutation(256).astype(np.uint8)
+    return np.concatenate((perm, perm))
+
 # Permutation table
-_perm = np.array([
-    151,160,137,91,90,15,
-    131,13,201,95,96,53,194,233,7,225,140,36,103,30,69,142,8,99,37,240,21,10,23,
-    190, 6,148,247,120,234,75,0,26,197,62,94,252,219,203,117,35,11,32,57,177,33,
-    88,237,149,56,87,174,20,125,136,171,168, 68,175,74,165,71,134,139,48,27,166,
-    77,146,158,231,83,111,229,122,60,211,133,230,220,105,92,41,55,46,245,40,244,
-    102,143,54, 65,25,63,161, 1,216,80,73,209,76,132,187,208, 89,18,169,200,196,
-    135,130,116,188,159,86,164,100,109,198,173,186, 3,64,52,217,226,250,124,123,
-    5,202,38,147,118,126,255,82,85,212,207,206,59,227,47,16,58,17,182,189,28,42,
-    223,183,170,213,119,248,152, 2,44,154,163, 70,221,153,101,155,167, 43,172,9,
-    129,22,39,253, 19,98,108,110,79,113,224,232,178,185,112,104,218,246,97,228,
-    251,34,242,193,238,210,144,12,191,179,162,241, 81,51,145,235,249,14,239,107,
-    49,192,214, 31,181,199,106,157,184, 84,204,176,115,121,50,45,127, 4,150,254,
-    138,236,205,93,222,114,67,29,24,72,243,141,128,195,78,66,215,61,156,180,
-    151,160,137,91,90,15,
-    131,13,201,95,96,53,194,233,7,225,140,36,103,30,69,142,8,99,37,240,21,10,23,
-    190, 6,148,247,120,234,75,0,26,197,62,94,252,219,203,117,35,11,32,57,177,33,
-    88,237,149,56,87,174,20,125,136,171,168, 68,175,74,165,71,134,139,48,27,166,
-    77,146,158,231,83,111,229,122,60,211,133,230,220,105,92,41,55,46,245,40,244,
-    102,143,54, 65,25,63,161, 1,216,80,73,209,76,132,187,208, 89,18,169,200,196,
-    135,130,116,188,159,86,164,100,109,198,173,186, 3,64,52,217,226,250,124,123,
-    5,202,38,147,118,126,255,82,85,212,207,206,59,227,47,16,58,17,182,189,28,42,
-    223,183,170,213,119,248,152, 2,44,154,163, 70,221,153,101,155,167, 43,172,9,
-    129,22,39,253, 19,98,108,110,79,113,224,232,178,185,112,104,218,246,97,228,
-    251,34,242,193,238,210,144,12,191,179,162,241, 81,51,145,235,249,14,239,107,
-    49,192,214, 31,181,199,106,157,184, 84,204,176,115,121,50,45,127, 4,150,254,
-    138,236,205,93,222,114,67,29,24,72,243,141,128,195,78,66,215,61,156,180
-], dtype=np.int32)
+# Numba freezes global arrays into the compiled code, so the table is fixed at import
+_perm = seed_noise(NOISE_SEED)
 
 # Gradient table (reshuffled)
 GRAD3 = np.array([
@@ -54,16 +43,7 @@ GRAD3 = np.array([
     0,1,1, 0,-1,1, 0,1,-1, 0,-1,-1
 ], dtype=np.int32)
 
-@njit
-def seed_noise(seed):
-    """Simple seeding by permuting the table based on seed"""
-    np.random.seed(seed)
-    # We can't modify global array inside njit easily if it's constant
-    # So we return a new perm table or just use different offsets?
-    # For now, let's keep it static but allow offset input
-    pass
-
-@njit
+@njit(inline='always', cache=True)
 def fast_noise2(x, y):
     """2D Simplex Noise"""
     # Skewing
@@ -123,7 +103,16 @@ def fast_noise2(x, y):
     # Scale result to [-1, 1] (Simplex noise usually in [-1, 1] but might need scaling)
     return 70.0 * (n0 + n1 + n2)
 
-@njit
+@njit(nogil=True, cache=True)
+def fast_noise2_grid(xs, ys):
+    """2D Simplex Noise evaluated over two same-shaped 2D coordinate arrays"""
+    out = np.empty(xs.shape, dtype=np.float64)
+    for i in range(xs.shape[0]):
+        for j in range(xs.shape[1]):
+            out[i, j] = fast_noise2(xs[i, j], ys[i, j])
+    return out
+
+@njit(inline='always', cache=True)
 def fast_noise3(x, y, z):
     """3D Simplex Noise"""
     F3 = 1.0 / 3.0
@@ -202,3 +191,13 @@ def fast_noise3(x, y, z):
         n3 = t3 * t3 * (GRAD3[idx]*x3 + GRAD3[idx+1]*y3 + GRAD3[idx+2]*z3)
         
     return 32.0 * (n0 + n1 + n2 + n3)
+
+@njit(nogil=True, cache=True)
+def fast_noise3_grid(xs, ys, zs):
+    """3D Simplex Noise evaluated over three same-shaped 3D coordinate arrays"""
+    out = np.empty(xs.shape, dtype=np.float64)
+    for i in range(xs.shape[0]):
+        for j in range(xs.shape[1]):
+            for k in range(xs.shape[2]):
+                out[i, j, k] = fast_noise3(xs[i, j, k], ys[i, j, k], zs[i, j, k])
+    return out
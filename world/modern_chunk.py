@@ -1,3 +1,4 @@
+import zlib
 import numpy as np
 from numba import njit
 import glm
@@ -17,15 +18,80 @@ WATER = 8
 CHUNK_SIZE = 16
 CHUNK_HEIGHT = 256
 
+# Block arrays are indexed [x, z, y] so each column is contiguous in memory
+CHUNK_SHAPE = (CHUNK_SIZE, CHUNK_SIZE, CHUNK_HEIGHT)
+
+# Unit cube corners (24 vertices, 4 per face) at the block origin
+# Face order matches the original cube_vertices function from main.py
+_CUBE_TEMPLATE = np.array([
+    # Top face
+    0,1,0, 0,1,1, 1,1,1, 1,1,0,
+    # Bottom face
+    0,0,0, 1,0,0, 1,0,1, 0,0,1,
+    # Left face
+    0,0,0, 0,0,1, 0,1,1, 0,1,0,
+    # Right face
+    1,0,1, 1,0,0, 1,1,0, 1,1,1,
+    # Front face
+    0,0,1, 1,0,1, 1,1,1, 0,1,1,
+    # Back face
+    1,0,0, 0,0,0, 0,1,0, 1,1,0,
+], dtype=np.float32).reshape(24, 3)
+
+# zlib level for saved block data (terrain is mostly long runs of AIR/STONE)
+BLOCK_COMPRESSION_LEVEL = 1
+
+def pack_nibbles(blocks):
+    """Pack a block array into 4 bits per block (all block types fit in 0-15)"""
+    flat = blocks.ravel()
+    return flat[0::2] | (flat[1::2] << 4)
+
+def unpack_nibbles(packed, out=None):
+    """
+    Inverse of pack_nibbles, returns a writable chunk-shaped block array
+    (written into out, a recycled chunk-shaped array, when given)
+    """
+    blocks = np.empty(packed.size * 2, dtype=np.uint8) if out is None else out.reshape(-1)
+    blocks[0::2] = packed & 0x0F
+    blocks[1::2] = packed >> 4
+    return blocks.reshape(CHUNK_SHAPE)
+
+def get_column_tops(blocks):
+    """
+    Per-column (CHUNK_SIZE, CHUNK_SIZE) int16 height above which the column is
+    all AIR (0 for an empty column). Used when blocks come without tops.
+    """
+    solid = blocks != AIR
+    tops = CHUNK_HEIGHT - np.argmax(solid[:, :, ::-1], axis=2)
+    tops[~solid.any(axis=2)] = 0
+    return tops.astype(np.int16)
+
+def get_column_floors(blocks):
+    """
+    Per-column (CHUNK_SIZE, CHUNK_SIZE) int16 height below which the column is
+    all solid (no AIR or WATER). Used when blocks come without floors.
+    """
+    open_space = (blocks == AIR) | (blocks == WATER)
+    floors = np.argmax(open_space, axis=2)
+    floors[~open_space.any(axis=2)] = CHUNK_HEIGHT
+    return floors.astype(np.int16)
+
 class ModernChunk:
-    def __init__(self, chunk_x, chunk_z, renderer, chunk_data=None, chunk_manager=None):
+    def __init__(self, chunk_x, chunk_z, renderer, chunk_data=None, chunk_manager=None, blocks=None,
+                 column_tops=None, column_floors=None, reuse_buffer=None):
         self.chunk_x = chunk_x
         self.chunk_z = chunk_z
         self.renderer = renderer
         self.chunk_manager = chunk_manager  # Reference to ThreadedChunkManager for async mesh requests
         
-        # Initialize block data
-        self.blocks = np.zeros((CHUNK_SIZE, CHUNK_HEIGHT, CHUNK_SIZE), dtype=np.uint8)
+        # Block data (assigned below from saved data, pre-generated blocks or new terrain)
+        self.blocks = None
+        # Per-column bound: everything at or above column_tops[x, z] is AIR
+        # (may overestimate after blocks are removed, never underestimates)
+        self.column_tops = None
+        # Per-column bound: everything below column_floors[x, z] is solid
+        # (may underestimate after blocks are placed, never overestimates)
+        self.column_floors = None
         
         # Rendering data
         self.vao = None
@@ -41,23 +107,34 @@ class ModernChunk:
         self.is_generated = False
         self.is_modified = False
         
-        # Load existing chunk data or generate new terrain
+        # Load existing chunk data, adopt blocks generated elsewhere (e.g. by a
+        # worker thread) or generate new terrain
         if chunk_data is not None:
-            self.load_chunk_data(chunk_data)
+            self.load_chunk_data(chunk_data, reuse_buffer)
+        elif blocks is not None:
+            self.blocks = blocks
+            self.column_tops = column_tops if column_tops is not None else get_column_tops(blocks)
+            self.column_floors = column_floors if column_floors is not None else get_column_floors(blocks)
+            self.is_generated = True
         else:
             self.generate_advanced_terrain()
     
     def generate_advanced_terrain(self):
         """Generate advanced terrain using the new terrain generator"""
         from world.terrain_generator import terrain_generator
-        terrain_generator.generate_chunk_terrain(self.chunk_x, self.chunk_z, self.blocks)
+        self.blocks, self.column_tops, self.column_floors = terrain_generator.generate_chunk_blocks(
+            self.chunk_x, self.chunk_z)
         self.is_generated = True
         self.needs_update = True
     
     def save_chunk_data(self):
         """Save chunk data for persistence"""
         return {
-            'blocks': self.blocks.copy(),
+            # Unloaded chunks keep blocks as compressed 4-bit nibbles (half the
+            # bytes to compress); this is an independent snapshot, so no copy() is needed
+            'blocks_packed': zlib.compress(pack_nibbles(self.blocks).tobytes(), BLOCK_COMPRESSION_LEVEL),
+            'column_tops': self.column_tops.copy(),
+            'column_floors': self.column_floors.copy(),
             'is_generated': self.is_generated,
             'is_modified': self.is_modified,
             'chunk_x': self.chunk_x,
@@ -68,9 +145,14 @@ class ModernChunk:
             'mesh_cache_valid': self.mesh_cache_valid
         }
     
-    def load_chunk_data(self, chunk_data):
-        """Load chunk data from saved state"""
-        self.blocks = chunk_data['blocks'].copy()
+    def load_chunk_data(self, chunk_data, reuse_buffer=None):
+        """Load chunk data from saved state (into reuse_buffer if one is given)"""
+        packed = np.frombuffer(zlib.decompress(chunk_data['blocks_packed']), dtype=np.uint8)
+        self.blocks = unpack_nibbles(packed, reuse_buffer)
+        column_tops = chunk_data.get('column_tops')
+        self.column_tops = column_tops.copy() if column_tops is not None else get_column_tops(self.blocks)
+        column_floors = chunk_data.get('column_floors')
+        self.column_floors = column_floors.copy() if column_floors is not None else get_column_floors(self.blocks)
         self.is_generated = chunk_data.get('is_generated', True)
         self.is_modified = chunk_data.get('is_modified', False)
         # Restore mesh cache if available
@@ -79,30 +161,6 @@ class ModernChunk:
         self.mesh_cache_valid = chunk_data.get('mesh_cache_valid', False)
         self.needs_update = True
 
-    def generate_simple_terrain(self):
-        """Generate proper layered terrain"""
-        for x in range(CHUNK_SIZE):
-            for z in range(CHUNK_SIZE):
-                # Calculate world coordinates
-                world_x = self.chunk_x * CHUNK_SIZE + x
-                world_z = self.chunk_z * CHUNK_SIZE + z
-                
-                # Generate height with some variation
-                base_height = 30
-                height_variation = int(3 * np.sin(world_x * 0.1) * np.cos(world_z * 0.1))
-                surface_height = base_height + height_variation
-                
-                # Generate terrain layers from bottom to top
-                for y in range(surface_height + 1):
-                    if y < surface_height - 3:
-                        self.blocks[x, y, z] = STONE  # Deep stone layer
-                    elif y < surface_height:
-                        self.blocks[x, y, z] = DIRT   # Dirt layer
-                    else:
-                        self.blocks[x, y, z] = GRASS  # Grass surface
-        
-        self.needs_update = True
-    
     def build_mesh(self):
         """Build mesh using Numba optimized fast builder"""
         if not self.needs_update:
@@ -117,26 +175,28 @@ class ModernChunk:
             indices_array = self.cached_indices
         else:
             # Generate new mesh using Numba function
-            vertices_array, indices_array = build_chunk_mesh_fast(self.blocks, self.chunk_x, self.chunk_z)
+            vertices_array, indices_array = build_chunk_mesh_fast(self.blocks, self.chunk_x, self.chunk_z,
+                                                                  self.column_tops, self.column_floors)
             
             # Cache the mesh data for future use
             self.cached_vertices = vertices_array
             self.cached_indices = indices_array
             self.mesh_cache_valid = True
         
-        # Create VAO if we have vertices
+        # Queue the mesh; the renderer uploads all queued meshes in one batch per frame
         if len(vertices_array) > 0:
-            # Clean up old VAO
-            if self.vao:
-                self.vao.release()
-            
-            # Create new VAO
-            self.vao = self.renderer.create_vao(vertices_array, indices_array)
-            self.vertex_count = len(indices_array)
+            self.renderer.queue_upload(self, vertices_array, indices_array)
             # print(f"Chunk ({self.chunk_x},{self.chunk_z}): Generated {len(vertices_array)//6} vertices, {len(indices_array)} indices")
         
         self.needs_update = False
     
+    def attach_vao(self, vao, vertex_count):
+        """Swap in a newly uploaded VAO, releasing the old one"""
+        if self.vao:
+            self.vao.release()
+        self.vao = vao
+        self.vertex_count = vertex_count
+    
     def is_face_exposed(self, x, y, z, dx, dy, dz):
         """Check if a face is exposed (adjacent block is air or out of bounds)"""
         nx, ny, nz = x + dx, y + dy, z + dz
@@ -146,28 +206,11 @@ class ModernChunk:
             return True
         
         # Adjacent block is air = exposed
-        return self.blocks[nx, ny, nz] == AIR
+        return self.blocks[nx, nz, ny] == AIR
     
     def get_cube_vertices(self, world_x, world_y, world_z):
-        """Generate all vertices for a complete cube using the original algorithm"""
-        # Using the same cube_vertices function from main.py
-        n = 0.5  # Half size
-        x, y, z = world_x + 0.5, world_y + 0.5, world_z + 0.5  # Center the cube
-        
-        return [
-            # Top face
-            x-n,y+n,z-n, x-n,y+n,z+n, x+n,y+n,z+n, x+n,y+n,z-n,
-            # Bottom face  
-            x-n,y-n,z-n, x+n,y-n,z-n, x+n,y-n,z+n, x-n,y-n,z+n,
-            # Left face
-            x-n,y-n,z-n, x-n,y-n,z+n, x-n,y+n,z+n, x-n,y+n,z-n,
-            # Right face
-            x+n,y-n,z+n, x+n,y-n,z-n, x+n,y+n,z-n, x+n,y+n,z+n,
-            # Front face
-            x-n,y-n,z+n, x+n,y-n,z+n, x+n,y+n,z+n, x-n,y+n,z+n,
-            # Back face
-            x+n,y-n,z-n, x-n,y-n,z-n, x-n,y+n,z-n, x+n,y+n,z-n,
-        ]
+        """Generate all vertices for a complete cube as a (24, 3) array"""
+        return _CUBE_TEMPLATE + np.array([world_x, world_y, world_z], dtype=np.float32)
     
     def get_block_texture_coords(self, block_type, face):
         """Get texture coordinates for a specific block type and face from texture atlas"""
@@ -257,13 +300,12 @@ class ModernChunk:
         }
         
         if face not in face_indices:
-            return []
+            return np.empty(0, dtype=np.float32)
         
         start, end = face_indices[face]
-        face_verts = cube_verts[start*3:end*3]  # *3 because each vertex has 3 coordinates
+        face_verts = cube_verts[start:end]
         
         # Add texture coordinates and shading for each vertex
-        vertices = []
         shading_values = {
             'top': 1.0,     # Brightest
             'bottom': 0.4,  # Darkest
@@ -285,41 +327,39 @@ class ModernChunk:
         # Combine base shading with ambient occlusion
         final_shading = shading * ao_value
         
-        for i in range(0, len(face_verts), 3):
-            x, y, z = face_verts[i], face_verts[i+1], face_verts[i+2]
-            # Get texture coordinate for this vertex (4 vertices per face)
-            vertex_idx = (i // 3) % 4
-            u, v = tex_coords[vertex_idx]
-            vertices.extend([x, y, z, u, v, final_shading])
+        # Fill all 4 vertices at once: x, y, z, u, v, shading
+        vertices = np.empty((4, 6), dtype=np.float32)
+        vertices[:, 0:3] = face_verts
+        vertices[:, 3:5] = tex_coords
+        vertices[:, 5] = final_shading
         
-        return vertices
+        return vertices.ravel()
     
     def get_block(self, x, y, z):
         """Get block type at local chunk coordinates"""
         if x < 0 or x >= CHUNK_SIZE or y < 0 or y >= CHUNK_HEIGHT or z < 0 or z >= CHUNK_SIZE:
             return AIR
-        return self.blocks[x, y, z]
+        return self.blocks[x, z, y]
     
     def set_block(self, x, y, z, block_type):
         """Set block type at local chunk coordinates"""
         if x < 0 or x >= CHUNK_SIZE or y < 0 or y >= CHUNK_HEIGHT or z < 0 or z >= CHUNK_SIZE:
             return
         
-        old_block = self.blocks[x, y, z]
+        old_block = self.blocks[x, z, y]
         if old_block != block_type:
-            self.blocks[x, y, z] = block_type
+            self.blocks[x, z, y] = block_type
+            if block_type != AIR and y >= self.column_tops[x, z]:
+                self.column_tops[x, z] = y + 1
+            if (block_type == AIR or block_type == WATER) and y < self.column_floors[x, z]:
+                self.column_floors[x, z] = y
             self.needs_update = True  # Mark chunk for mesh rebuild
             self.is_modified = True   # Mark chunk as modified by player
             self.mesh_cache_valid = False  # Invalidate cache since blocks changed
             
             # Request async mesh rebuild if chunk_manager is available
             if self.chunk_manager:
-                priority = self.chunk_manager._calculate_chunk_priority(self.chunk_x, self.chunk_z)
-                self.chunk_manager.mesh_request_counter += 1
-                self.chunk_manager.mesh_build_queue.put((priority, self.chunk_manager.mesh_request_counter, {
-                    'coords': (self.chunk_x, self.chunk_z),
-                    'chunk': self
-                }))
+                self.chunk_manager.request_mesh_build(self)
     
     def render(self):
         """Render this chunk"""
@@ -10,8 +10,10 @@ Features:
 
 import numpy as np
 import math
+import threading
+from collections import OrderedDict
 from numba import njit
-from world.fast_noise import fast_noise2, fast_noise3, seed_noise
+from world.fast_noise import fast_noise2, fast_noise2_grid, fast_noise3_grid, NOISE_SEED
 
 # Block type constants
 AIR = 0
@@ -28,11 +30,15 @@ WATER = 8
 CHUNK_SIZE = 16
 CHUNK_HEIGHT = 256
 
+# Block arrays are indexed [x, z, y] so each column is contiguous in memory
+CHUNK_SHAPE = (CHUNK_SIZE, CHUNK_SIZE, CHUNK_HEIGHT)
+
 # World generation settings
-WORLD_SEED = 42
+WORLD_SEED = NOISE_SEED  # Seeds the noise permutation table in fast_noise
 CENTER_Y = 48  # Base terrain height like ornek2
 WORLD_CENTER = 480  # World center for island generation
 WATER_LINE = 11.95  # Water level like ornek2
+ISLAND_RADIUS_SQ = 2000.0 * 2000.0  # Island mask starts 2000 blocks from WORLD_CENTER
 
 # Terrain levels (Y coordinates) - from ornek2
 SNOW_LEVEL = 54
@@ -41,6 +47,15 @@ DIRT_LEVEL = 40
 GRASS_LEVEL = 11
 SAND_LEVEL = 5
 
+# Surface block for each (height - random falloff), checked from highest to lowest
+# Anything below SAND_LEVEL (very low/underground) defaults to stone
+SURFACE_LUT = np.full(CHUNK_HEIGHT, STONE, dtype=np.uint8)
+SURFACE_LUT[SAND_LEVEL:GRASS_LEVEL] = SAND
+SURFACE_LUT[GRASS_LEVEL:DIRT_LEVEL] = GRASS
+SURFACE_LUT[DIRT_LEVEL:STONE_LEVEL] = DIRT
+SURFACE_LUT[STONE_LEVEL:SNOW_LEVEL] = STONE
+SURFACE_LUT[SNOW_LEVEL:] = SNOW
+
 # Noise frequencies for different octaves
 FREQ_1 = 0.005   # Large terrain features
 FREQ_2 = 0.01    # Medium features  
@@ -58,21 +73,68 @@ CAVE_FREQUENCY = 0.05
 CAVE_THRESHOLD = 0.0
 CAVE_MIN_Y = 5
 CAVE_MAX_Y_OFFSET = 10
+CAVE_STRIDE = 4  # Cave noise is sampled every CAVE_STRIDE blocks and interpolated between
+
+# Height map caching (tiles are shared by all chunks they cover)
+HEIGHT_TILE_SIZE = 64  # Must be a multiple of CHUNK_SIZE
+MAX_HEIGHT_TILES = 256  # ~2 MB of int16 heights
 
 # Tree generation
 TREE_PROBABILITY = 0.03
 TREE_HEIGHT = 6
 TREE_WIDTH = 2
 TREE_H_WIDTH = 1
+TREE_THRESHOLD = int(round(TREE_PROBABILITY * 256))  # Compared against a uint8 roll
+LEAVES_SIZE = 2    # Creates a 5x5 cube (2 blocks in each direction from center)
+LEAVES_HEIGHT = 4  # 4 layers of leaves
 
-@njit
-def fast_rand(x, y, z):
-    """Deterministic random float between 0.0 and 1.0 based on coordinates"""
-    # Simple hash based random
-    n = int(x * 374761393 + y * 668265263 + z * 437585453)
-    n = (n ^ (n >> 13)) * 1274126177
-    return ((n * (n * n * 15731 + 789221) + 1376312589) & 0x7fffffff) / 2147483647.0
+# Density decreases as we go up (more leaves at bottom): 100%, 80%, 60%, 40%
+# Stored as thresholds for a 0-255 roll (256 always places a leaf)
+LEAVES_THRESHOLD = np.round((1.0 - np.arange(LEAVES_HEIGHT) * 0.2) * 256).astype(np.int16)
+
+# Branch directions for tree side extensions (indexed by a hashed 0-7)
+_DX = np.array([1, -1, 0, 0, 1, -1, 1, -1], dtype=np.int8)
+_DZ = np.array([0, 0, 1, -1, 1, -1, -1, 1], dtype=np.int8)
+
+# Per-column random tile layers (see get_column_rng)
+RNG_SURFACE = 0  # Surface falloff
+RNG_TREE = 1     # Tree placement roll
+RNG_LAYERS = 2
+
+# Coordinate hash constants (xxHash64 primes and the murmur3 finalizer multiplier)
+_HASH_X = np.uint64(0x9E3779B185EBCA87)
+_HASH_Y = np.uint64(0x165667B19E3779F9)
+_HASH_Z = np.uint64(0xC2B2AE3D27D4EB4F)
+_HASH_MIX = np.uint64(0xFF51AFD7ED558CCD)
+_SHIFT_33 = np.uint64(33)
+_SHIFT_56 = np.uint64(56)
+
+@njit(inline='always', cache=True)
+def hash_coords(x, y, z):
+    """64-bit hash of integer coordinates (all math stays in uint64 so it wraps)"""
+    n = (np.uint64(np.int64(x)) * _HASH_X) ^ (np.uint64(np.int64(y)) * _HASH_Y) ^ (np.uint64(np.int64(z)) * _HASH_Z)
+    n ^= n >> _SHIFT_33
+    n *= _HASH_MIX
+    n ^= n >> _SHIFT_33
+    return n
+
+def hash_coords_grid(x, y, z):
+    """hash_coords over broadcastable int64 coordinate arrays (same hash, NumPy wraps arrays silently)"""
+    x, y, z = np.broadcast_arrays(np.asarray(x, dtype=np.int64), np.asarray(y, dtype=np.int64),
+                                  np.asarray(z, dtype=np.int64))
+    n = (x.astype(np.uint64) * _HASH_X) ^ (y.astype(np.uint64) * _HASH_Y) ^ (z.astype(np.uint64) * _HASH_Z)
+    n ^= n >> _SHIFT_33
+    n *= _HASH_MIX
+    n ^= n >> _SHIFT_33
+    return n
+
+@njit(cache=True)
+def fast_rand_u8(x, y, z):
+    """Deterministic random integer between 0 and 255 based on coordinates"""
+    return int(hash_coords(x, y, z) >> _SHIFT_56)
 
+# Not disk-cached: it inlines fast_noise2, and the cache would not notice changes
+# to fast_noise.py (see the note there)
 @njit
 def get_terrain_height(world_x, world_z):
     """
@@ -103,18 +165,125 @@ def get_terrain_height(world_x, world_z):
     # Apply much gentler island mask for near-spawn area
     dx = x - WORLD_CENTER
     dz = z - WORLD_CENTER
-    distance = math.sqrt(dx*dx + dz*dz)
+    dist_sq = dx*dx + dz*dz
     
-    if distance > 2000.0:  # Only apply island mask far from center
+    if dist_sq > ISLAND_RADIUS_SQ:  # Only apply island mask far from center
+        distance = math.sqrt(dist_sq)
         island_factor = max(0.1, 1.0 - (distance - 2000.0) / 3000.0)
         height *= island_factor
     
     return int(max(height, 8.0))
 
-@njit
-def get_block_type(world_x, world_y, world_z, terrain_height):
+def get_terrain_heightmap(world_x, world_z, size_x, size_z):
+    """
+    Vectorized get_terrain_height over a size_x x size_z grid of columns
+    starting at (world_x, world_z). Returns an int16 array indexed [x, z].
+    """
+    x = (world_x + np.arange(size_x, dtype=np.float64))[:, None]
+    z = (world_z + np.arange(size_z, dtype=np.float64))[None, :]
+    x, z = np.broadcast_arrays(x, z)
+    
+    # Terrain variation (from ornek2) as a select instead of a per-column branch.
+    # Only the base octave is scaled; AMP_2-AMP_8 stay derived from CENTER_Y.
+    a1 = np.where(fast_noise2_grid(0.1 * x, 0.1 * z) < 0, AMP_1 / 1.07, float(AMP_1))
+    
+    # The finest octave is also the height floor, so sample it once
+    detail = fast_noise2_grid(x * FREQ_8, z * FREQ_8)
+    
+    # Accumulate octaves in place (same operation order as get_terrain_height)
+    height = fast_noise2_grid(x * FREQ_1, z * FREQ_1)
+    height *= a1
+    height += a1
+    octave = fast_noise2_grid(x * FREQ_2, z * FREQ_2)
+    octave *= AMP_2
+    octave -= AMP_2
+    height += octave
+    octave = fast_noise2_grid(x * FREQ_4, z * FREQ_4)
+    octave *= AMP_4
+    octave += AMP_4
+    height += octave
+    np.multiply(detail, AMP_8, out=octave)
+    octave -= AMP_8
+    height += octave
+    
+    np.add(detail, 2.0, out=octave)
+    np.maximum(height, octave, out=height)
+    
+    # Gentle island mask far from the world center
+    # Compare squared distances; only the few far columns need the sqrt
+    dx = x - WORLD_CENTER
+    dz = z - WORLD_CENTER
+    dist_sq = dx*dx + dz*dz
+    far = dist_sq > ISLAND_RADIUS_SQ
+    if far.any():
+        distance = np.sqrt(dist_sq[far])
+        height[far] *= np.maximum(0.1, 1.0 - (distance - 2000.0) / 3000.0)
+    
+    return np.maximum(height, 8.0).astype(np.int16)
+
+def get_column_rng(chunk_x, chunk_z):
+    """
+    Random bytes for every column of a chunk as a (RNG_LAYERS, CHUNK_SIZE, CHUNK_SIZE)
+    uint8 tile, hashed for the whole chunk at once from the world column.
+    Each layer takes a different byte of the hash so they are independent.
+    """
+    wx = (chunk_x * CHUNK_SIZE + np.arange(CHUNK_SIZE, dtype=np.int64))[:, None]
+    wz = (chunk_z * CHUNK_SIZE + np.arange(CHUNK_SIZE, dtype=np.int64))[None, :]
+    
+    # Same coordinate hash as the voxel-level rolls; y = -1 is never a voxel, so
+    # column bytes don't repeat any fast_rand_u8 roll
+    h = hash_coords_grid(wx, -1, wz)
+    
+    tile = np.empty((RNG_LAYERS, CHUNK_SIZE, CHUNK_SIZE), dtype=np.uint8)
+    for layer in range(RNG_LAYERS):
+        # Top bytes first, like fast_rand_u8
+        tile[layer] = (h >> np.uint64(56 - 8 * layer)) & np.uint64(0xFF)
+    return tile
+
+def get_cave_lattice_size(heights):
+    """Number of lattice layers sample_cave_noise needs to cover the tallest column"""
+    top_max = min(int(heights.max()) + 1, CHUNK_HEIGHT)
+    return (top_max - 1) // CAVE_STRIDE + 2
+
+def sample_cave_noise(chunk_x, chunk_z, y_count):
+    """
+    Cave noise inputs of fill_columns, sampled here with the fast_noise grid
+    kernels so no disk-cached kernel in this module compiles in the noise code.
+    Returns (lattice, cave_low):
+    lattice: (n, n, y_count) 3D cave noise on a world-aligned lattice every
+             CAVE_STRIDE blocks. It includes the chunk's far edges, so neighbouring
+             chunks share their boundary samples and caves line up across chunks.
+    cave_low: (CHUNK_SIZE, CHUNK_SIZE) lower end of each column's cave band
+    """
+    lattice_xz = np.arange(0, CHUNK_SIZE + 1, CAVE_STRIDE)
+    lattice_y = np.arange(y_count) * CAVE_STRIDE
+    lx_grid, lz_grid, ly_grid = np.meshgrid(chunk_x * CHUNK_SIZE + lattice_xz, chunk_z * CHUNK_SIZE + lattice_xz,
+                                            lattice_y, indexing='ij')
+    lattice = fast_noise3_grid(lx_grid * 0.09, ly_grid * 0.09, lz_grid * 0.09)
+    
+    wx = chunk_x * CHUNK_SIZE + np.arange(CHUNK_SIZE, dtype=np.int64)
+    wz = chunk_z * CHUNK_SIZE + np.arange(CHUNK_SIZE, dtype=np.int64)
+    x2, z2 = np.broadcast_arrays(wx[:, None], wz[None, :])
+    cave_low = fast_noise2_grid(x2 * 0.1, z2 * 0.1)
+    cave_low *= 3
+    cave_low += 3
+    return lattice, cave_low
+
+@njit(inline='always', cache=True)
+def interpolate_cave_noise(cave_column, world_y):
+    """Cave noise at world_y from a column of lattice samples (see fill_columns)"""
+    k = world_y // CAVE_STRIDE
+    t = (world_y % CAVE_STRIDE) / CAVE_STRIDE
+    return cave_column[k] + (cave_column[k + 1] - cave_column[k]) * t
+
+@njit(cache=True)
+def get_block_type(world_y, terrain_height, surface_offset, cave_column, cave_low, cave_high):
     """
     Determine block type based on position and terrain height (from ornek2)
+    surface_offset: random falloff (0-6) for this column (see fill_columns)
+    cave_column: cave noise lattice samples for this column
+    cave_low, cave_high: caves can only open strictly between these heights
+    (per column, see fill_columns)
     """
     if world_y > terrain_height:
         # Add water at low levels
@@ -125,38 +294,25 @@ def get_block_type(world_x, world_y, world_z, terrain_height):
     # Underground structure (from ornek2)
     if world_y < terrain_height - 1:
         # Create caves (from ornek2)
-        # Using 3D noise
-        cave_n1 = fast_noise3(world_x * 0.09, world_y * 0.09, world_z * 0.09)
-        cave_n2 = fast_noise2(world_x * 0.1, world_z * 0.1)
+        # Using 3D noise, interpolated from the coarse lattice
+        cave_n1 = interpolate_cave_noise(cave_column, world_y)
         
-        if (cave_n1 > 0 and cave_n2 * 3 + 3 < world_y < terrain_height - 10):
+        if (cave_n1 > 0) & (world_y > cave_low) & (world_y < cave_high):
             return AIR
         else:
             return STONE
     else:
         # Surface layer with variation (from ornek2)
         # Random falloff
-        rng = int(7 * fast_rand(world_x, world_y, world_z))
-        ry = world_y - rng
+        ry = world_y - surface_offset
         
-        # Fixed logic: check from highest to lowest, with proper fallbacks
-        if ry >= SNOW_LEVEL:
-            return SNOW  # High mountains get snow
-        elif ry >= STONE_LEVEL:
-            return STONE  # High elevation gets stone
-        elif ry >= DIRT_LEVEL:
-            return DIRT   # Medium elevation gets dirt
-        elif ry >= GRASS_LEVEL:
-            return GRASS  # Low-medium elevation gets grass
-        elif ry >= SAND_LEVEL:
-            return SAND   # Low elevation gets sand
-        else:
-            return STONE  # Very low/underground defaults to stone
+        return SURFACE_LUT[min(max(ry, 0), CHUNK_HEIGHT - 1)]
 
-@njit
-def should_place_tree(world_x, world_y, world_z, block_type):
+@njit(cache=True)
+def should_place_tree(world_y, block_type, tree_roll):
     """
     Determine if a tree should be placed at this location (from ornek2)
+    tree_roll: the column's RNG_TREE byte from get_column_rng
     """
     # Only place trees on grass and below dirt level
     if block_type != GRASS or world_y >= DIRT_LEVEL:
@@ -166,45 +322,38 @@ def should_place_tree(world_x, world_y, world_z, block_type):
     if world_y <= WATER_LINE:
         return False
     
-    # Use spatial hash for random
-    rnd = fast_rand(world_x, world_y, world_z)
-    return rnd <= TREE_PROBABILITY
+    return tree_roll < TREE_THRESHOLD
 
-@njit
+@njit(cache=True)
 def generate_tree_fast(blocks, local_x, local_y, local_z):
     """
     Generate a tree structure (Numba optimized)
+    Returns False if the tree does not fit in the chunk and nothing was placed.
     """
-    TREE_H_WIDTH_LOCAL = 1
-    TREE_HEIGHT_LOCAL = 6
-    
     # Check bounds
-    if local_y + TREE_HEIGHT_LOCAL >= CHUNK_HEIGHT:
-        return
-    if local_x - TREE_H_WIDTH_LOCAL < 0 or local_x + TREE_H_WIDTH_LOCAL >= CHUNK_SIZE:
-        return
-    if local_z - TREE_H_WIDTH_LOCAL < 0 or local_z + TREE_H_WIDTH_LOCAL >= CHUNK_SIZE:
-        return
+    if local_y + TREE_HEIGHT >= CHUNK_HEIGHT:
+        return False
+    if local_x - TREE_H_WIDTH < 0 or local_x + TREE_H_WIDTH >= CHUNK_SIZE:
+        return False
+    if local_z - TREE_H_WIDTH < 0 or local_z + TREE_H_WIDTH >= CHUNK_SIZE:
+        return False
     
     # Dirt under the tree (from ornek2)
-    blocks[local_x, local_y, local_z] = DIRT
+    blocks[local_x, local_z, local_y] = DIRT
     
     # Define leaves area - cube around the top of the tree
-    leaves_size = 2  # Creates a 5x5 cube (2 blocks in each direction from center)
-    leaves_bottom_y = local_y + TREE_HEIGHT_LOCAL - 3  # Start leaves 3 blocks from tree top
-    leaves_height = 4  # 4 layers of leaves
+    leaves_bottom_y = local_y + TREE_HEIGHT - 3  # Start leaves 3 blocks from tree top
     
-    for layer in range(leaves_height):
+    for layer in range(LEAVES_HEIGHT):
         current_y = leaves_bottom_y + layer
         if current_y >= CHUNK_HEIGHT:
             break
-            
-        # Density decreases as we go up (more leaves at bottom)
-        density = 1.0 - (layer * 0.2)  # 100%, 80%, 60%, 40% density per layer
+        
+        threshold = LEAVES_THRESHOLD[layer]
         
         # Generate cube of leaves for this layer
-        for ix in range(-leaves_size, leaves_size + 1):
-            for iz in range(-leaves_size, leaves_size + 1):
+        for ix in range(-LEAVES_SIZE, LEAVES_SIZE + 1):
+            for iz in range(-LEAVES_SIZE, LEAVES_SIZE + 1):
                 leaves_x = local_x + ix
                 leaves_z = local_z + iz
                 
@@ -216,106 +365,232 @@ def generate_tree_fast(blocks, local_x, local_y, local_z):
                     
                     # Place leaves based on density
                     # Pseudo-random check
-                    rng = fast_rand(leaves_x, current_y, leaves_z)
-                    if rng < density:
-                        blocks[leaves_x, current_y, leaves_z] = LEAVES
+                    if fast_rand_u8(leaves_x, current_y, leaves_z) < threshold:
+                        blocks[leaves_x, leaves_z, current_y] = LEAVES
     
     # Add random side extensions to make tree more natural
     # We use a fixed deterministic loop instead of random.choice/range
     for i in range(8):  
         # Mock random direction using hash
-        h = fast_rand(local_x + i, local_y, local_z + i)
-        direction_idx = int(h * 8) % 8
+        direction_idx = fast_rand_u8(local_x + i, local_y, local_z + i) & 7
         
-        dx = 0
-        dz = 0
-        if direction_idx == 0: dx=1; dz=0
-        elif direction_idx == 1: dx=-1; dz=0
-        elif direction_idx == 2: dx=0; dz=1
-        elif direction_idx == 3: dx=0; dz=-1
-        elif direction_idx == 4: dx=1; dz=1
-        elif direction_idx == 5: dx=-1; dz=-1
-        elif direction_idx == 6: dx=1; dz=-1
-        elif direction_idx == 7: dx=-1; dz=1
+        dx = int(_DX[direction_idx])
+        dz = int(_DZ[direction_idx])
         
-        extend_x = local_x + dx * (leaves_size + 1)
-        extend_z = local_z + dz * (leaves_size + 1)
+        extend_x = local_x + dx * (LEAVES_SIZE + 1)
+        extend_z = local_z + dz * (LEAVES_SIZE + 1)
         
         # Random height offset 0-2
-        h2 = fast_rand(extend_x, local_y, extend_z)
-        offset_y = int(h2 * 3)
+        offset_y = (fast_rand_u8(extend_x, local_y, extend_z) * 3) >> 8
         extend_y = leaves_bottom_y + offset_y
         
         if (0 <= extend_x < CHUNK_SIZE and 0 <= extend_z < CHUNK_SIZE and 
             extend_y < CHUNK_HEIGHT):
-            blocks[extend_x, extend_y, extend_z] = LEAVES
+            blocks[extend_x, extend_z, extend_y] = LEAVES
     
     # Tree trunk
-    for iy in range(1, TREE_HEIGHT_LOCAL - 2):
+    for iy in range(1, TREE_HEIGHT - 2):
         trunk_y = local_y + iy
         if trunk_y < CHUNK_HEIGHT:
-            blocks[local_x, trunk_y, local_z] = WOOD
+            blocks[local_x, local_z, trunk_y] = WOOD
     
     # Top
-    top_y = local_y + TREE_HEIGHT_LOCAL - 2
+    top_y = local_y + TREE_HEIGHT - 2
     if top_y < CHUNK_HEIGHT:
-        blocks[local_x, top_y, local_z] = LEAVES
+        blocks[local_x, local_z, top_y] = LEAVES
+    
+    return True
 
-@njit
-def generate_chunk_fast(chunk_x, chunk_z, blocks):
+@njit(nogil=True, cache=True)
+def fill_columns(blocks, heights, rng, lattice, cave_lows, surface_types, tops, floors):
     """
-    Main chunk generation function (JIT compiled)
+    Terrain pass: classify the voxels of each column up to its surface height.
+    blocks must start zeroed; nothing above the surface is written.
+    lattice and cave_lows come from sample_cave_noise (lattice may have extra layers).
+    Records the surface block of each column in surface_types, the end of
+    its solid part in tops and the first non-solid voxel (cave or air) in floors.
     """
+    # Coarse cave noise up to the tallest column
+    top_max = min(int(heights.max()) + 1, CHUNK_HEIGHT)
+    y_count = (top_max - 1) // CAVE_STRIDE + 2
+    cave_column = np.empty(y_count, dtype=np.float64)
+    
     for lx in range(CHUNK_SIZE):
         for lz in range(CHUNK_SIZE):
-            wx = chunk_x * CHUNK_SIZE + lx
-            wz = chunk_z * CHUNK_SIZE + lz
+            h = int(heights[lx, lz])
+            top = min(h + 1, CHUNK_HEIGHT)
+            surface_offset = (int(rng[RNG_SURFACE, lx, lz]) * 7) >> 8
             
-            h = get_terrain_height(wx, wz)
+            # Cave band of this column (from ornek2)
+            cave_low = cave_lows[lx, lz]
+            cave_high = h - 10
             
-            # Reduce loop range to valid terrain
-            # But we must fill everything to be block_type
-            # However, blocks is pre-filled with AIR (0).
-            # So we only iterate up to h?
-            # But get_block_type also handles caves underground.
+            # Bilinear blend of the four lattice columns around this one
+            ix = lx // CAVE_STRIDE
+            iz = lz // CAVE_STRIDE
+            fx = (lx % CAVE_STRIDE) / CAVE_STRIDE
+            fz = (lz % CAVE_STRIDE) / CAVE_STRIDE
+            for k in range(y_count):
+                a = lattice[ix, iz, k] + (lattice[ix + 1, iz, k] - lattice[ix, iz, k]) * fx
+                b = lattice[ix, iz + 1, k] + (lattice[ix + 1, iz + 1, k] - lattice[ix, iz + 1, k]) * fx
+                cave_column[k] = a + (b - a) * fz
             
-            # The original code iterated up to min(h+1, CHUNK_HEIGHT)
-            for ly in range(min(h + 1, CHUNK_HEIGHT)):
-                wy = ly
-                b_type = get_block_type(wx, wy, wz, h)
-                blocks[lx, ly, lz] = b_type
-                
-                # Tree check
-                if ly == h and b_type == GRASS:
-                    if should_place_tree(wx, wy, wz, b_type):
-                         generate_tree_fast(blocks, lx, ly, lz)
+            # Terrain and caves up to the surface (h is fixed for the whole column)
+            floor = top
+            for ly in range(top):
+                block = get_block_type(ly, h, surface_offset, cave_column, cave_low, cave_high)
+                blocks[lx, lz, ly] = block
+                if block == AIR and ly < floor:
+                    floor = ly
+            tops[lx, lz] = top
+            floors[lx, lz] = floor
+            
+            if h < CHUNK_HEIGHT:
+                surface_types[lx, lz] = blocks[lx, lz, h]
+
+@njit(nogil=True, cache=True)
+def place_trees(blocks, heights, rng, surface_types, tops):
+    """
+    Populator pass: only looks at the surface block of each column.
+    Raises tops over the footprint of every tree it places.
+    """
+    for lx in range(CHUNK_SIZE):
+        for lz in range(CHUNK_SIZE):
+            if surface_types[lx, lz] == GRASS:
+                h = int(heights[lx, lz])
+                if should_place_tree(h, GRASS, rng[RNG_TREE, lx, lz]):
+                    if generate_tree_fast(blocks, lx, h, lz):
+                        tree_top = h + TREE_HEIGHT + 1
+                        reach = LEAVES_SIZE + 1  # Side branches stick out one past the leaves
+                        for tx in range(max(lx - reach, 0), min(lx + reach + 1, CHUNK_SIZE)):
+                            for tz in range(max(lz - reach, 0), min(lz + reach + 1, CHUNK_SIZE)):
+                                tops[tx, tz] = max(tops[tx, tz], tree_top)
+
+@njit(nogil=True, cache=True)
+def generate_chunk_fast(blocks, heights, rng, lattice, cave_lows, tops, floors):
+    """
+    Main chunk generation function (JIT compiled)
+    heights: (CHUNK_SIZE, CHUNK_SIZE) terrain height for each column
+    rng: per-column random tile from get_column_rng
+    lattice, cave_lows: cave noise from sample_cave_noise
+    tops: (CHUNK_SIZE, CHUNK_SIZE) output, every voxel of a column at or
+          above its top is AIR
+    floors: (CHUNK_SIZE, CHUNK_SIZE) output, every voxel of a column below
+            its floor is solid
+    
+    Only voxels up to each column's top are written, so blocks must be
+    zeroed (AIR) first. Trees reach into neighbouring columns and are
+    placed in a separate pass afterwards.
+    """
+    surface_types = np.zeros((CHUNK_SIZE, CHUNK_SIZE), dtype=np.uint8)
+    
+    fill_columns(blocks, heights, rng, lattice, cave_lows, surface_types, tops, floors)
+    place_trees(blocks, heights, rng, surface_types, tops)
+
+@njit(nogil=True, cache=True)
+def generate_chunk_batch(blocks, heights, rng, lattices, cave_lows, tops, floors):
+    """
+    generate_chunk_fast over a batch of chunks in one kernel call.
+    Every array argument has the batch as its first axis.
+    """
+    for i in range(blocks.shape[0]):
+        generate_chunk_fast(blocks[i], heights[i], rng[i], lattices[i], cave_lows[i], tops[i], floors[i])
 
 class AdvancedTerrainGenerator:
     """
     Advanced terrain generator using multi-octave noise (Numba Optimized)
     """
     
-    def __init__(self, seed=WORLD_SEED):
-        self.seed = seed
-        # Initialize noise with seed (Not actually used in fast_noise yet, but ready)
-        # np.random.seed(seed)
+    def __init__(self):
+        # The noise permutation table is baked into the fast_noise kernels, so the
+        # seed is fixed at import (change NOISE_SEED in fast_noise to use another world)
+        self.seed = WORLD_SEED
+        
+        # LRU cache of height tiles keyed by (tile_x, tile_z)
+        # Chunks are generated from worker threads, so guard it with a lock
+        self.height_tiles = OrderedDict()
+        self.height_tiles_lock = threading.Lock()
+        
+        # No JIT warmup needed: the kernels are cached on disk (cache=True),
+        # so only the very first launch pays the compile time
+    
+    def get_height_tile(self, tile_x, tile_z):
+        """
+        Get a cached height tile, generating it on first use
+        """
+        key = (tile_x, tile_z)
+        with self.height_tiles_lock:
+            tile = self.height_tiles.get(key)
+            if tile is not None:
+                self.height_tiles.move_to_end(key)
+                return tile
+        
+        # Generate outside the lock; a duplicate tile from a race is harmless
+        tile = get_terrain_heightmap(tile_x * HEIGHT_TILE_SIZE, tile_z * HEIGHT_TILE_SIZE,
+                                     HEIGHT_TILE_SIZE, HEIGHT_TILE_SIZE)
+        
+        with self.height_tiles_lock:
+            self.height_tiles[key] = tile
+            if len(self.height_tiles) > MAX_HEIGHT_TILES:
+                self.height_tiles.popitem(last=False)
+        return tile
+    
+    def get_chunk_heights(self, chunk_x, chunk_z):
+        """
+        Get the (CHUNK_SIZE, CHUNK_SIZE) height map of a chunk from its tile
+        """
+        world_x = chunk_x * CHUNK_SIZE
+        world_z = chunk_z * CHUNK_SIZE
+        tile_x = world_x // HEIGHT_TILE_SIZE
+        tile_z = world_z // HEIGHT_TILE_SIZE
+        offset_x = world_x - tile_x * HEIGHT_TILE_SIZE
+        offset_z = world_z - tile_z * HEIGHT_TILE_SIZE
+        
+        tile = self.get_height_tile(tile_x, tile_z)
+        return tile[offset_x:offset_x + CHUNK_SIZE, offset_z:offset_z + CHUNK_SIZE]
+    
+    def generate_chunk_blocks(self, chunk_x, chunk_z):
+        """
+        Generate a new block array for a chunk (safe to call from worker threads)
+        Returns (blocks, column_tops, column_floors)
+        """
+        blocks = np.zeros(CHUNK_SHAPE, dtype=np.uint8)
+        column_tops, column_floors = self.generate_chunk_terrain(chunk_x, chunk_z, blocks)
+        return blocks, column_tops, column_floors
+    
+    def generate_chunk_batch_blocks(self, coords):
+        """
+        Generate several chunks with a single kernel call (safe to call from
+        worker threads). Returns a list of (blocks, column_tops, column_floors)
+        in coords order.
+        The block arrays are views of one allocation, so batches should stay small.
+        """
+        count = len(coords)
+        heights = np.stack([self.get_chunk_heights(chunk_x, chunk_z) for chunk_x, chunk_z in coords])
+        rng = np.stack([get_column_rng(chunk_x, chunk_z) for chunk_x, chunk_z in coords])
+        # Cave lattices sampled to the tallest chunk of the batch so they stack
+        y_count = get_cave_lattice_size(heights)
+        lattices, cave_lows = zip(*[sample_cave_noise(chunk_x, chunk_z, y_count) for chunk_x, chunk_z in coords])
+        blocks = np.zeros((count,) + CHUNK_SHAPE, dtype=np.uint8)
+        tops = np.zeros((count, CHUNK_SIZE, CHUNK_SIZE), dtype=np.int16)
+        floors = np.zeros((count, CHUNK_SIZE, CHUNK_SIZE), dtype=np.int16)
         
-        # Warmup JIT (Optional but good for first frame spike prevention)
-        # We can call the function with dummy data
-        print("Warming up Terrain Generator JIT...")
-        dummy = np.zeros((16, 256, 16), dtype=np.uint8)
-        generate_chunk_fast(0, 0, dummy)
-        print("Terrain Generator JIT Ready.")
+        generate_chunk_batch(blocks, heights, rng, np.stack(lattices), np.stack(cave_lows), tops, floors)
+        return [(blocks[i], tops[i], floors[i]) for i in range(count)]
     
     def generate_chunk_terrain(self, chunk_x, chunk_z, blocks):
         """
         Generate terrain for a chunk using advanced algorithms
+        blocks must be zeroed; returns the chunk's (column_tops, column_floors)
         """
-        # Clear the blocks array
-        blocks.fill(AIR)
-        
-        # Generate terrain using Numba function
-        generate_chunk_fast(chunk_x, chunk_z, blocks)
+        # Generate terrain using Numba function (writes only up to each column top)
+        heights = self.get_chunk_heights(chunk_x, chunk_z)
+        rng = get_column_rng(chunk_x, chunk_z)
+        tops = np.zeros((CHUNK_SIZE, CHUNK_SIZE), dtype=np.int16)
+        floors = np.zeros((CHUNK_SIZE, CHUNK_SIZE), dtype=np.int16)
+        lattice, cave_lows = sample_cave_noise(chunk_x, chunk_z, get_cave_lattice_size(heights))
+        generate_chunk_fast(blocks, heights, rng, lattice, cave_lows, tops, floors)
+        return tops, floors
 
 # Global terrain generator instance
 terrain_generator = AdvancedTerrainGenerator()
@@ -1,25 +1,149 @@
 import math
+import os
 import glm
+import heapq
+import collections
+import numpy as np
 import threading
-import queue
-import time
-from world.modern_chunk import ModernChunk
+from concurrent.futures import ThreadPoolExecutor
+from world.modern_chunk import ModernChunk, CHUNK_SIZE, CHUNK_SHAPE
+from world.fast_builder import build_chunk_mesh_fast
+from world.terrain_generator import terrain_generator
 from engine.frustum import Frustum
 from engine.occlusion import OcclusionCuller
 
+def chunk_key(chunk_x, chunk_z):
+    """Pack chunk coordinates into a single int key (valid while |coord| < 2**31)"""
+    return (chunk_x << 32) + chunk_z
+
+def key_to_chunk(key):
+    """Inverse of chunk_key, returns (chunk_x, chunk_z)"""
+    chunk_x = (key + 0x80000000) >> 32
+    return chunk_x, key - (chunk_x << 32)
+
+# States of a chunk key in ThreadedChunkManager.chunk_states
+CHUNK_PENDING = 0  # Load requested, not integrated yet
+CHUNK_READY = 1  # In self.chunks
+CHUNK_UNLOADING = 2  # In self.chunks with an unload request in flight
+
+# Unloaded chunks kept in memory before the least useful ones are dropped
+MAX_CACHED_CHUNKS = 1024
+
+class ChunkCache:
+    """
+    Saved data of unloaded chunks with LRU-2 eviction: the entry whose second
+    most recent access is oldest goes first, so chunks only passed through once
+    are dropped before chunks the player keeps coming back to.
+    Modified chunks are never evicted since they cannot be regenerated.
+    An access is one visit: loading a chunk (get) and saving it again when it
+    unloads (put) count once. Thread-safe (the chunk worker reads while the
+    main thread saves).
+    """
+    
+    def __init__(self, capacity=MAX_CACHED_CHUNKS):
+        self.capacity = capacity
+        self.entries = {}  # chunk key -> saved chunk data
+        self.evictable = set()  # Keys of entries that are not modified
+        self.history = {}  # chunk key -> (last access, access before that or 0)
+        self.checked_out = set()  # Keys loaded by get whose visit is already counted
+        self.clock = 0
+        self.lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def _touch(self, key):
+        self.clock += 1
+        last = self.history.get(key)
+        self.history[key] = (self.clock, last[0] if last else 0)
+    
+    def get(self, key):
+        """Saved data for key (counts as an access), or None"""
+        with self.lock:
+            data = self.entries.get(key)
+            if data is not None:
+                self._touch(key)
+                self.checked_out.add(key)
+            return data
+    
+    def put(self, key, data):
+        """Store saved data for key, evicting if over capacity"""
+        with self.lock:
+            self.entries[key] = data
+            if data.get('is_modified'):
+                self.evictable.discard(key)
+            else:
+                self.evictable.add(key)
+            if key in self.checked_out:
+                # Unload at the end of a visit that get() already counted
+                self.checked_out.discard(key)
+            else:
+                self._touch(key)
+            if len(self.entries) > self.capacity and self.evictable:
+                self._evict()
+    
+    def _evict(self):
+        # Drop down to 90% of capacity at once so the sort is paid every ~100 saves;
+        # with mostly modified entries only the few evictable ones are sorted
+        target = self.capacity * 9 // 10
+        candidates = sorted(self.evictable, key=lambda key: (self.history[key][1], self.history[key][0]))
+        for key in candidates[:len(self.entries) - target]:
+            del self.entries[key]
+            del self.history[key]
+            self.evictable.discard(key)
+            self.checked_out.discard(key)
+
+class ChunkBitmap:
+    """
+    Set of chunk keys stored as one 256-bit int per 16x16 chunk region, so
+    explored areas cost a few bytes per chunk instead of a set entry each.
+    Only supports what explored_chunks needs: add, `in` and len().
+    """
+    
+    def __init__(self):
+        self.regions = {}  # chunk_key(chunk_x >> 4, chunk_z >> 4) -> bitmask of its chunks
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def _locate(self, key):
+        chunk_x, chunk_z = key_to_chunk(key)
+        return chunk_key(chunk_x >> 4, chunk_z >> 4), 1 << (((chunk_x & 15) << 4) | (chunk_z & 15))
+    
+    def add(self, key):
+        region, bit = self._locate(key)
+        mask = self.regions.get(region, 0)
+        if not mask & bit:
+            self.regions[region] = mask | bit
+            self.count += 1
+    
+    def __contains__(self, key):
+        region, bit = self._locate(key)
+        return bool(self.regions.get(region, 0) & bit)
+
 class ThreadedChunkManager:
     """Manages dynamic chunk loading and unloading with background threading to eliminate lag"""
     
     def __init__(self, renderer, render_distance=8):
         self.renderer = renderer
         self.render_distance = render_distance
-        self.chunks = {}  # Dictionary of (x, z) -> chunk (main thread access)
-        self.loaded_chunks = set()  # Set of (x, z) coordinates for loaded chunks
+        # Chunk sets and dicts are keyed by chunk_key(x, z) ints rather than (x, z) tuples
+        self.chunks = {}  # Dictionary of chunk key -> chunk (main thread access)
+        self._chunk_index = None  # Array snapshot of self.chunks for render culling, None when stale
+        # Chunk key -> CHUNK_PENDING/READY/UNLOADING for every chunk requested or loaded;
+        # self.chunks holds the chunk objects of the READY and UNLOADING ones
+        self.chunk_states = {}
         self.last_player_chunk = None
+        self._range_offsets = {}  # render_distance -> (N, 2) chunk offsets inside the circle
         
         # Chunk persistence system
-        self.chunk_cache = {}  # Cache for unloaded but persistent chunks
-        self.explored_chunks = set()  # Set of chunk coordinates that have been generated
+        self.chunk_cache = ChunkCache()  # Chunk key -> saved data for unloaded but persistent chunks
+        self.explored_chunks = ChunkBitmap()  # Chunk keys that have been generated
+        self.chunk_pool = collections.deque(maxlen=64)  # Block arrays of unloaded chunks, reused by cache loads
+        
+        # Per-chunk / per-move progress prints (stdout writes stall the main thread)
+        self.debug_logging = False
         
         # Pre-generation settings
         self.initial_chunks_generated = False
@@ -28,19 +152,45 @@ class ThreadedChunkManager:
         # Threading components
         self.loading_thread = None
         self.should_stop = False
-        self.chunk_queue = queue.Queue()  # Queue for chunk operations
-        self.completed_chunks = queue.Queue()  # Completed chunks ready for main thread
-        self.chunks_to_unload = queue.Queue()  # Chunks to be unloaded
-        self.thread_lock = threading.Lock()
+        self.chunk_queue = collections.deque()  # Chunk unload operations for the chunk worker
+        self.load_heap = []  # heapq of (squared chunk distance, chunk_x, chunk_z) - closest loads first
+        self.load_heap_lock = threading.Lock()
+        # Worker -> main thread results; deque append/popleft are atomic, so no locks needed
+        self.completed_chunks = collections.deque()  # Completed chunks ready for main thread
+        self.chunks_to_unload = collections.deque()  # Chunks to be unloaded
+        self.work_event = threading.Event()  # Set whenever chunk_queue or load_heap gets work
+        
+        # Terrain generation pool - the Numba kernels release the GIL,
+        # so independent chunks generate in parallel
+        self.generation_workers = max(1, (os.cpu_count() or 2) - 1)
+        self.generation_pool = ThreadPoolExecutor(
+            max_workers=self.generation_workers,
+            thread_name_prefix='chunk-gen'
+        )
+        self.generation_batch_size = 4  # Max chunks generated per kernel call
+        # Batches submitted but not finished (guarded by load_heap_lock). Loads stay in
+        # load_heap until a worker is free, so they can still be re-ranked or dropped
+        self.generation_in_flight = 0
         
         # Async mesh building queues
-        self.mesh_build_queue = queue.PriorityQueue()  # Priority queue - closer chunks processed first
-        self.completed_meshes = queue.Queue()  # Completed mesh data ready for VAO creation
-        self.player_position = glm.vec3(0, 0, 0)  # Track player position for priority calculation
+        self.mesh_build_heap = []  # heapq of (priority, counter, request) - closer chunks processed first
+        self.mesh_build_ready = threading.Condition()  # Guards mesh_build_heap, notified on every push
+        self.completed_meshes = collections.deque()  # Completed mesh data ready for VAO creation
+        self._player_cx = 0  # Player chunk coordinates, cached each update() for mesh priorities
+        self._player_cz = 0
         self.mesh_request_counter = 0  # Counter for tiebreaker in priority queue
         
+        # Mesh builder threads - the mesher releases the GIL, so chunks mesh in parallel
+        self.mesh_generation_threads = max(1, (os.cpu_count() or 2) - 2)
+        self.mesh_threads = []
+        self.meshing_chunks = set()  # Chunks a mesh worker is building right now
+        self.deferred_meshes = {}  # Rebuilds requested while that chunk was being meshed
+        self.meshing_lock = threading.Lock()
+        
         # Frustum culling
         self.frustum = Frustum()
+        self._frustum_matrices = None  # (view, proj) copies the current planes were extracted from
+        self._render_cache = None  # (chunk index, camera/settings key, culling result) of the last frame
         self.enable_frustum_culling = True
         
         # Occlusion culling
@@ -48,7 +198,8 @@ class ThreadedChunkManager:
         self.enable_occlusion_culling = True
         
         # Conservative mode by default to prevent over-culling
-        self.occlusion_culler.set_conservative_mode(True)
+        self.occlusion_conservative = True
+        self.occlusion_culler.set_conservative_mode(self.occlusion_conservative)
         
         # Start background thread
         self.start_background_thread()
@@ -64,7 +215,6 @@ class ThreadedChunkManager:
         print(f"Pre-generating {self.chunks_to_pregenerate} chunks around spawn ({spawn_x}, {spawn_z})...")
         
         # Calculate spawn chunk coordinates
-        from world.modern_chunk import CHUNK_SIZE
         spawn_chunk_x = int(spawn_x // CHUNK_SIZE)
         spawn_chunk_z = int(spawn_z // CHUNK_SIZE)
         
@@ -83,12 +233,15 @@ class ThreadedChunkManager:
                 # Build mesh synchronously for pre-generated chunks so they're ready immediately
                 chunk.build_mesh()
                 
-                self.chunks[(x, z)] = chunk
-                self.loaded_chunks.add((x, z))
-                self.explored_chunks.add((x, z))
+                key = chunk_key(x, z)
+                self.chunks[key] = chunk
+                self._chunk_index = None
+                self.chunk_states[key] = CHUNK_READY
+                self.explored_chunks.add(key)
                 generated_count += 1
                 
-                print(f"Pre-generated chunk ({x}, {z}) - {generated_count}/{self.chunks_to_pregenerate}")
+                if self.debug_logging:
+                    print(f"Pre-generated chunk ({x}, {z}) - {generated_count}/{self.chunks_to_pregenerate}")
             
             if generated_count >= self.chunks_to_pregenerate:
                 break
@@ -98,142 +251,227 @@ class ThreadedChunkManager:
     
     def save_chunk_to_cache(self, chunk_x, chunk_z):
         """Save chunk data to cache before unloading"""
-        if (chunk_x, chunk_z) in self.chunks:
-            chunk = self.chunks[(chunk_x, chunk_z)]
-            self.chunk_cache[(chunk_x, chunk_z)] = chunk.save_chunk_data()
-            self.explored_chunks.add((chunk_x, chunk_z))
+        key = chunk_key(chunk_x, chunk_z)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunk_cache.put(key, chunk.save_chunk_data())
+            self.explored_chunks.add(key)
             return True
         return False
     
     def load_chunk_from_cache(self, chunk_x, chunk_z):
         """Load chunk data from cache if available"""
-        if (chunk_x, chunk_z) in self.chunk_cache:
-            chunk_data = self.chunk_cache[(chunk_x, chunk_z)]
-            chunk = ModernChunk(chunk_x, chunk_z, self.renderer, chunk_data, chunk_manager=self)
+        chunk_data = self.chunk_cache.get(chunk_key(chunk_x, chunk_z))
+        if chunk_data is not None:
+            try:
+                reuse_buffer = self.chunk_pool.popleft()
+            except IndexError:
+                reuse_buffer = None
+            chunk = ModernChunk(chunk_x, chunk_z, self.renderer, chunk_data, chunk_manager=self,
+                                reuse_buffer=reuse_buffer)
             return chunk
         return None
     
     def is_chunk_explored(self, chunk_x, chunk_z):
         """Check if a chunk has been previously generated/explored"""
-        return (chunk_x, chunk_z) in self.explored_chunks
+        return chunk_key(chunk_x, chunk_z) in self.explored_chunks
     
     def start_background_thread(self):
-        """Start the background chunk loading thread"""
+        """Start the background chunk loading and mesh building threads"""
         self.loading_thread = threading.Thread(target=self._chunk_worker, daemon=True)
         self.loading_thread.start()
+        
+        self.mesh_threads = [
+            threading.Thread(target=self._mesh_worker, daemon=True, name=f'chunk-mesh-{i}')
+            for i in range(self.mesh_generation_threads)
+        ]
+        for thread in self.mesh_threads:
+            thread.start()
     
     def _chunk_worker(self):
-        """Background thread worker for chunk loading and mesh building"""
+        """Background thread worker for chunk loading and unloading"""
         while not self.should_stop:
+            # Sleep until something is queued (or cleanup wakes us to exit)
+            self.work_event.wait()
+            self.work_event.clear()
+            
+            # Failures are handled per operation, so one bad chunk doesn't stall the rest
+            while not self.should_stop and self._process_chunk_operations():
+                pass
+    
+    def _process_chunk_operations(self):
+        """Handle queued load/unload requests, batching new chunks for the pool"""
+        operations = self._pop_ready(self.chunk_queue, len(self.chunk_queue))
+        for operation in operations:
+            if operation['type'] == 'unload':
+                self.chunks_to_unload.append(operation['coords'])
+        
+        # Closest chunks first, at most one generation batch per idle pool worker;
+        # _on_chunks_generated wakes this thread again when a batch finishes
+        with self.load_heap_lock:
+            free_workers = self.generation_workers - self.generation_in_flight
+            count = min(free_workers * self.generation_batch_size, len(self.load_heap))
+            loads = [heapq.heappop(self.load_heap) for _ in range(count)]
+        
+        to_generate = []
+        for _, chunk_x, chunk_z in loads:
             try:
-                # Check for chunk loading requests
-                try:
-                    operation = self.chunk_queue.get(timeout=0.1)
-                    if operation['type'] == 'load':
-                        chunk_x, chunk_z = operation['coords']
-                        
-                        # Try to load from cache first
-                        chunk = self.load_chunk_from_cache(chunk_x, chunk_z)
-                        if chunk is None:
-                            # Create new chunk if not in cache
-                            chunk = ModernChunk(chunk_x, chunk_z, self.renderer, chunk_data=None, chunk_manager=self)
-                            self.explored_chunks.add((chunk_x, chunk_z))
-                        
-                        # Queue it for main thread integration
-                        self.completed_chunks.put({
-                            'type': 'loaded',
-                            'coords': (chunk_x, chunk_z),
-                            'chunk': chunk
-                        })
-                    elif operation['type'] == 'unload':
-                        chunk_x, chunk_z = operation['coords']
-                        self.chunks_to_unload.put((chunk_x, chunk_z))
-                except queue.Empty:
-                    pass
-                
-                # Check for mesh building requests (priority queue format)
-                try:
-                    priority_item = self.mesh_build_queue.get(timeout=0.01)
-                    # PriorityQueue returns (priority, counter, data) tuple
-                    priority, counter, mesh_request = priority_item
-                    chunk_coords = mesh_request['coords']
-                    chunk = mesh_request['chunk']
-                    
-                    # Build mesh in background thread
-                    from world.fast_builder import build_chunk_mesh_fast
-                    vertices_array, indices_array = build_chunk_mesh_fast(
-                        chunk.blocks, chunk.chunk_x, chunk.chunk_z
-                    )
-                    
-                    # Queue completed mesh for main thread
-                    self.completed_meshes.put({
-                        'coords': chunk_coords,
-                        'vertices': vertices_array,
-                        'indices': indices_array
-                    })
-                except queue.Empty:
-                    pass
-                    
+                # Try to load from cache first
+                chunk = self.load_chunk_from_cache(chunk_x, chunk_z)
             except Exception as e:
-                print(f"Error in chunk worker thread: {e}")
-                time.sleep(0.1)
+                print(f"Error loading chunk ({chunk_x}, {chunk_z}) from cache: {e}")
+                self.completed_chunks.append({'type': 'failed', 'coords': (chunk_x, chunk_z)})
+                continue
+            
+            if chunk is None:
+                # Not in cache - generate the blocks on the pool
+                to_generate.append((chunk_x, chunk_z))
+            else:
+                # Queue it for main thread integration
+                self.completed_chunks.append({
+                    'type': 'loaded',
+                    'coords': (chunk_x, chunk_z),
+                    'chunk': chunk
+                })
+        
+        if to_generate:
+            try:
+                self._submit_generation(to_generate, free_workers)
+            except RuntimeError as e:
+                # The pool refuses new work once cleanup has shut it down
+                print(f"Error submitting chunk generation: {e}")
+                for chunk_coords in to_generate:
+                    self.completed_chunks.append({'type': 'failed', 'coords': chunk_coords})
+        return len(operations) > 0 or len(loads) > 0
+    
+    def _mesh_worker(self):
+        """Background thread worker for mesh building, several run at once"""
+        while True:
+            with self.mesh_build_ready:
+                while not self.mesh_build_heap and not self.should_stop:
+                    self.mesh_build_ready.wait()
+                if self.should_stop:
+                    break
+                # Heap entries are (priority, counter, data) tuples
+                priority, counter, mesh_request = heapq.heappop(self.mesh_build_heap)
+            
+            chunk_coords = mesh_request['coords']
+            with self.meshing_lock:
+                if mesh_request['chunk'].blocks is None:
+                    continue  # Chunk was unloaded and its blocks recycled
+                if chunk_coords in self.meshing_chunks:
+                    # Another worker is meshing this chunk - rebuild once it is done
+                    # so the newest mesh is always the last one delivered
+                    self.deferred_meshes[chunk_coords] = (priority, counter, mesh_request)
+                    continue
+                self.meshing_chunks.add(chunk_coords)
+            
+            try:
+                self._build_mesh(mesh_request)
+            except Exception as e:
+                print(f"Error building mesh for chunk {chunk_coords}: {e}")
+            finally:
+                with self.meshing_lock:
+                    self.meshing_chunks.discard(chunk_coords)
+                    deferred = self.deferred_meshes.pop(chunk_coords, None)
+                if deferred is not None:
+                    self._push_mesh_request(deferred)
+    
+    def _build_mesh(self, mesh_request):
+        """Build a chunk mesh and queue it for VAO creation on the main thread"""
+        chunk = mesh_request['chunk']
+        
+        # Build mesh in background thread
+        vertices_array, indices_array = build_chunk_mesh_fast(
+            chunk.blocks, chunk.chunk_x, chunk.chunk_z, chunk.column_tops, chunk.column_floors
+        )
+        
+        # Queue completed mesh for main thread
+        self.completed_meshes.append({
+            'coords': mesh_request['coords'],
+            'vertices': vertices_array,
+            'indices': indices_array
+        })
+    
+    def _submit_generation(self, coords_list, free_workers):
+        """Split chunks to generate evenly over the idle pool workers, one kernel call per task"""
+        batch_count = min(free_workers, len(coords_list))
+        batch_size = -(-len(coords_list) // batch_count)  # Ceiling division
+        for start in range(0, len(coords_list), batch_size):
+            batch = coords_list[start:start + batch_size]
+            with self.load_heap_lock:
+                self.generation_in_flight += 1
+            try:
+                future = self.generation_pool.submit(terrain_generator.generate_chunk_batch_blocks, batch)
+            except RuntimeError:
+                with self.load_heap_lock:
+                    self.generation_in_flight -= 1
+                raise
+            future.add_done_callback(lambda f, batch=batch: self._on_chunks_generated(batch, f))
+    
+    def _on_chunks_generated(self, batch, future):
+        """Generation pool callback - hand the new blocks to the main thread"""
+        # A pool worker is free again - let the chunk worker submit the next batch
+        with self.load_heap_lock:
+            self.generation_in_flight -= 1
+        self.work_event.set()
+        
+        try:
+            results = future.result()
+        except Exception as e:
+            print(f"Error generating chunks {batch}: {e}")
+            for chunk_coords in batch:
+                self.completed_chunks.append({'type': 'failed', 'coords': chunk_coords})
+            return
+        
+        for chunk_coords, (blocks, column_tops, column_floors) in zip(batch, results):
+            self.completed_chunks.append({
+                'type': 'generated',
+                'coords': chunk_coords,
+                'blocks': blocks,
+                'column_tops': column_tops,
+                'column_floors': column_floors
+            })
     
     def _calculate_chunk_priority(self, chunk_x, chunk_z):
         """Calculate priority for chunk based on distance to player (lower = higher priority)"""
-        from world.modern_chunk import CHUNK_SIZE
-        # Calculate chunk center world position
-        chunk_center_x = (chunk_x * CHUNK_SIZE) + (CHUNK_SIZE / 2)
-        chunk_center_z = (chunk_z * CHUNK_SIZE) + (CHUNK_SIZE / 2)
-        
-        # Calculate distance to player (use 2D distance, ignore Y)
-        dx = chunk_center_x - self.player_position.x
-        dz = chunk_center_z - self.player_position.z
-        distance = math.sqrt(dx*dx + dz*dz)
-        
-        return distance  # Lower distance = higher priority
+        # Squared distance in chunk units from the player's chunk - same ordering, integer math
+        dx = chunk_x - self._player_cx
+        dz = chunk_z - self._player_cz
+        return dx*dx + dz*dz
     
     def clear_distant_mesh_requests(self):
         """Clear mesh requests for chunks that are now too far from player"""
-        from world.modern_chunk import CHUNK_SIZE
-        current_chunk_x = int(self.player_position.x // CHUNK_SIZE)
-        current_chunk_z = int(self.player_position.z // CHUNK_SIZE)
-        
-        # Create new queue with only relevant chunks
-        new_queue = queue.PriorityQueue()
-        cleared_count = 0
-        kept_count = 0
-        
-        # Drain existing queue
-        while True:
-            try:
-                priority_item = self.mesh_build_queue.get_nowait()
-                priority, counter, mesh_request = priority_item
-                chunk_x, chunk_z = mesh_request['coords']
-                
-                # Calculate chunk distance in chunk coordinates
-                chunk_dx = abs(chunk_x - current_chunk_x)
-                chunk_dz = abs(chunk_z - current_chunk_z)
-                
-                # Only keep chunks within render distance
-                if chunk_dx <= self.render_distance and chunk_dz <= self.render_distance:
-                    # Recalculate priority with current player position
-                    new_priority = self._calculate_chunk_priority(chunk_x, chunk_z)
-                    new_queue.put((new_priority, counter, mesh_request))
-                    kept_count += 1
-                else:
-                    cleared_count += 1
-            except queue.Empty:
-                break
-        
-        # Replace queue
-        self.mesh_build_queue = new_queue
+        current_chunk_x = self._player_cx
+        current_chunk_z = self._player_cz
+        
+        # Filter the pending heap in place under one lock acquisition
+        with self.mesh_build_ready:
+            items = self.mesh_build_heap
+            if not items:
+                return
+            coords = np.array([item[2]['coords'] for item in items])
+            
+            # Only keep chunks within render distance (in chunk coordinates)
+            dx = coords[:, 0] - current_chunk_x
+            dz = coords[:, 1] - current_chunk_z
+            keep = (np.abs(dx) <= self.render_distance) & (np.abs(dz) <= self.render_distance)
+            
+            # Recalculate priorities with current player position (see _calculate_chunk_priority)
+            priorities = dx*dx + dz*dz
+            
+            items[:] = [(priority, item[1], item[2])
+                        for priority, item, kept in zip(priorities.tolist(), items, keep.tolist()) if kept]
+            heapq.heapify(items)
+            
+            kept_count = len(items)
+            cleared_count = len(keep) - kept_count
         
-        if cleared_count > 0:
+        if cleared_count > 0 and self.debug_logging:
             print(f"Cleared {cleared_count} distant mesh requests, kept {kept_count}")
     
     def world_to_chunk_coords(self, world_x, world_z):
         """Convert world coordinates to chunk coordinates"""
-        from world.modern_chunk import CHUNK_SIZE
         chunk_x = int(world_x // CHUNK_SIZE)
         chunk_z = int(world_z // CHUNK_SIZE)
         return chunk_x, chunk_z
@@ -242,155 +480,241 @@ class ThreadedChunkManager:
         """Get the chunk coordinates the player is currently in"""
         return self.world_to_chunk_coords(player_pos.x, player_pos.z)
     
+    def _get_range_offsets(self):
+        """(N, 2) int64 chunk offsets inside the circular render distance"""
+        # The offsets only depend on the distance, so build them once
+        offsets = self._range_offsets.get(self.render_distance)
+        if offsets is None:
+            r = self.render_distance
+            xs, zs = np.mgrid[-r:r + 1, -r:r + 1]
+            inside = xs * xs + zs * zs <= r * r
+            offsets = np.stack([xs[inside], zs[inside]], axis=1).astype(np.int64)
+            self._range_offsets[r] = offsets
+        return offsets
+    
     def get_chunks_in_range(self, center_chunk_x, center_chunk_z):
         """Get all chunk coordinates within render distance of center chunk"""
-        chunks_in_range = set()
-        
-        for x in range(center_chunk_x - self.render_distance, 
-                      center_chunk_x + self.render_distance + 1):
-            for z in range(center_chunk_z - self.render_distance, 
-                          center_chunk_z + self.render_distance + 1):
-                # Use circular render distance
-                distance = math.sqrt((x - center_chunk_x)**2 + (z - center_chunk_z)**2)
-                if distance <= self.render_distance:
-                    chunks_in_range.add((x, z))
-        
-        return chunks_in_range
+        coords = self._get_range_offsets() + (center_chunk_x, center_chunk_z)
+        return set(map(tuple, coords.tolist()))
+    
+    def get_chunk_keys_in_range(self, center_chunk_x, center_chunk_z):
+        """Same as get_chunks_in_range, but as a set of chunk_key ints"""
+        coords = self._get_range_offsets() + (center_chunk_x, center_chunk_z)
+        return set(((coords[:, 0] << 32) + coords[:, 1]).tolist())
     
     def request_chunk_load(self, chunk_x, chunk_z):
         """Request a chunk to be loaded in the background"""
-        if (chunk_x, chunk_z) not in self.chunks and (chunk_x, chunk_z) not in self.loaded_chunks:
-            self.chunk_queue.put({
-                'type': 'load',
-                'coords': (chunk_x, chunk_z)
-            })
+        key = chunk_key(chunk_x, chunk_z)
+        # chunk_states holds every loaded chunk as well as pending ones
+        if key not in self.chunk_states:
+            priority = self._calculate_chunk_priority(chunk_x, chunk_z)
+            with self.load_heap_lock:
+                heapq.heappush(self.load_heap, (priority, chunk_x, chunk_z))
+            self.work_event.set()
             # Mark as pending to avoid duplicate requests
-            self.loaded_chunks.add((chunk_x, chunk_z))
+            self.chunk_states[key] = CHUNK_PENDING
             return True
         return False
     
+    def _reprioritize_loads(self):
+        """Re-rank pending loads after the player changed chunk, dropping ones now out of range"""
+        r2 = self.render_distance * self.render_distance
+        with self.load_heap_lock:
+            kept = []
+            for _, chunk_x, chunk_z in self.load_heap:
+                priority = self._calculate_chunk_priority(chunk_x, chunk_z)
+                if priority <= r2:
+                    kept.append((priority, chunk_x, chunk_z))
+                else:
+                    # No longer wanted - forget it so it can be requested again later
+                    self.chunk_states.pop(chunk_key(chunk_x, chunk_z), None)
+            heapq.heapify(kept)
+            self.load_heap[:] = kept
+    
     def request_chunk_unload(self, chunk_x, chunk_z):
         """Request a chunk to be unloaded"""
-        if (chunk_x, chunk_z) in self.chunks:
-            self.chunk_queue.put({
+        key = chunk_key(chunk_x, chunk_z)
+        if self.chunk_states.get(key) == CHUNK_READY:
+            self.chunk_states[key] = CHUNK_UNLOADING
+            self.chunk_queue.append({
                 'type': 'unload',
                 'coords': (chunk_x, chunk_z)
             })
+            self.work_event.set()
             return True
         return False
     
+    def request_mesh_build(self, chunk):
+        """Queue a chunk for background mesh building, closest chunks first"""
+        priority = self._calculate_chunk_priority(chunk.chunk_x, chunk.chunk_z)
+        self.mesh_request_counter += 1
+        self._push_mesh_request((priority, self.mesh_request_counter, {
+            'coords': (chunk.chunk_x, chunk.chunk_z),
+            'chunk': chunk
+        }))
+    
+    def _push_mesh_request(self, item):
+        """Add a (priority, counter, request) entry to the mesh heap and wake one mesh worker"""
+        with self.mesh_build_ready:
+            heapq.heappush(self.mesh_build_heap, item)
+            self.mesh_build_ready.notify()
+    
+    def _pop_ready(self, pending, limit):
+        """Pop up to limit items from one of the thread hand-off deques"""
+        ready = []
+        for _ in range(limit):
+            try:
+                ready.append(pending.popleft())
+            except IndexError:
+                break
+        return ready
+    
     def process_completed_chunks(self):
         """Process chunks that have been loaded in the background (call from main thread)"""
         processed = 0
-        max_per_frame = 12  # Increased for faster updates when player moves quickly
-        
-        while processed < max_per_frame:
-            try:
-                result = self.completed_chunks.get_nowait()
-                if result['type'] == 'loaded':
-                    chunk_x, chunk_z = result['coords']
+        max_per_frame = 12  # Unloads per frame (each one compresses the chunk's blocks)
+        
+        # Integrating chunks and meshes is cheap, so take everything that is ready;
+        # the GPU work is budgeted by the renderer's flush_uploads instead
+        for result in self._pop_ready(self.completed_chunks, len(self.completed_chunks)):
+            if result['type'] == 'failed':
+                # Forget the pending request so it can be retried
+                key = chunk_key(*result['coords'])
+                if self.chunk_states.get(key) == CHUNK_PENDING:
+                    del self.chunk_states[key]
+            elif result['type'] in ('loaded', 'generated'):
+                chunk_x, chunk_z = result['coords']
+                key = chunk_key(chunk_x, chunk_z)
+                if self.chunk_states.get(key) != CHUNK_PENDING:
+                    # Dropped while in flight (or re-requested and already integrated)
+                    self._discard_result(result)
+                    continue
+                dx = chunk_x - self._player_cx
+                dz = chunk_z - self._player_cz
+                if dx*dx + dz*dz > self.render_distance * self.render_distance:
+                    # Player moved away while it was loading - forget it so it can be requested again
+                    del self.chunk_states[key]
+                    self._discard_result(result)
+                    continue
+                if result['type'] == 'generated':
+                    # Wrap freshly generated blocks on the main thread
+                    chunk = ModernChunk(chunk_x, chunk_z, self.renderer,
+                                        chunk_manager=self, blocks=result['blocks'],
+                                        column_tops=result['column_tops'],
+                                        column_floors=result['column_floors'])
+                    self.explored_chunks.add(key)
+                else:
                     chunk = result['chunk']
+                
+                # Check if chunk has cached mesh - if so, upload it with this frame's batch
+                if chunk.mesh_cache_valid and chunk.cached_vertices is not None:
+                    vertices = chunk.cached_vertices
+                    indices = chunk.cached_indices
                     
-                    # Check if chunk has cached mesh - if so, create VAO immediately
-                    if chunk.mesh_cache_valid and chunk.cached_vertices is not None:
-                        # Create VAO from cached mesh on main thread
-                        vertices = chunk.cached_vertices
-                        indices = chunk.cached_indices
-                        
-                        if len(vertices) > 0:
-                            if chunk.vao:
-                                chunk.vao.release()
-                            chunk.vao = self.renderer.create_vao(vertices, indices)
-                            chunk.vertex_count = len(indices)
-                        
-                        chunk.needs_update = False
-                    elif chunk.needs_update:
-                        # No cached mesh - request mesh building in background with priority
-                        priority = self._calculate_chunk_priority(chunk_x, chunk_z)
-                        self.mesh_request_counter += 1
-                        self.mesh_build_queue.put((priority, self.mesh_request_counter, {
-                            'coords': (chunk_x, chunk_z),
-                            'chunk': chunk
-                        }))
-                    
-                    # Add chunk to loaded chunks now that it's ready (or mesh is building)
-                    with self.thread_lock:
-                        self.chunks[(chunk_x, chunk_z)] = chunk
-                    
-                    processed += 1
+                    if len(vertices) > 0:
+                        self.renderer.queue_upload(chunk, vertices, indices)
                     
-            except queue.Empty:
-                break
+                    chunk.needs_update = False
+                elif chunk.needs_update:
+                    # No cached mesh - request mesh building in background with priority
+                    self.request_mesh_build(chunk)
+                
+                # Add chunk to loaded chunks now that it's ready (or mesh is building)
+                self.chunks[key] = chunk
+                self.chunk_states[key] = CHUNK_READY
+                self._chunk_index = None
+                
+                processed += 1
         
-        # Process completed meshes and create VAOs (main thread only for OpenGL)
-        mesh_processed = 0
-        while mesh_processed < max_per_frame:
-            try:
-                mesh_data = self.completed_meshes.get_nowait()
-                chunk_coords = mesh_data['coords']
-                vertices = mesh_data['vertices']
-                indices = mesh_data['indices']
+        # Process completed meshes and queue their uploads
+        for mesh_data in self._pop_ready(self.completed_meshes, len(self.completed_meshes)):
+            vertices = mesh_data['vertices']
+            indices = mesh_data['indices']
+            
+            # Get the chunk and hand its mesh to the renderer
+            chunk = self.chunks.get(chunk_key(*mesh_data['coords']))
+            if chunk is not None:
+                # Update chunk's cached mesh data
+                chunk.cached_vertices = vertices
+                chunk.cached_indices = indices
+                chunk.mesh_cache_valid = True
                 
-                # Get the chunk and create VAO on main thread
-                with self.thread_lock:
-                    if chunk_coords in self.chunks:
-                        chunk = self.chunks[chunk_coords]
-                        
-                        # Update chunk's cached mesh data
-                        chunk.cached_vertices = vertices
-                        chunk.cached_indices = indices
-                        chunk.mesh_cache_valid = True
-                        
-                        # Create VAO on main thread (OpenGL requirement)
-                        if len(vertices) > 0:
-                            if chunk.vao:
-                                chunk.vao.release()
-                            chunk.vao = self.renderer.create_vao(vertices, indices)
-                            chunk.vertex_count = len(indices)
-                        
-                        chunk.needs_update = False
-                        mesh_processed += 1
-            except queue.Empty:
-                break
+                # Queued for the renderer's batched upload (main thread only for OpenGL)
+                if len(vertices) > 0:
+                    self.renderer.queue_upload(chunk, vertices, indices)
+                
+                chunk.needs_update = False
         
         # Process unload requests
         unload_count = 0
-        while unload_count < max_per_frame:
-            try:
-                chunk_x, chunk_z = self.chunks_to_unload.get_nowait()
-                self.unload_chunk_immediate(chunk_x, chunk_z)
-                unload_count += 1
-            except queue.Empty:
-                break
+        for chunk_x, chunk_z in self._pop_ready(self.chunks_to_unload, max_per_frame):
+            if self._is_in_range(chunk_x, chunk_z):
+                # Player came back before the unload was processed
+                key = chunk_key(chunk_x, chunk_z)
+                if key in self.chunk_states:
+                    self.chunk_states[key] = CHUNK_READY
+                continue
+            self.unload_chunk_immediate(chunk_x, chunk_z)
+            unload_count += 1
         
         return processed, unload_count
     
+    def _is_in_range(self, chunk_x, chunk_z):
+        """True if the chunk is inside render distance of the player's current chunk"""
+        if self.last_player_chunk is None:
+            return False
+        dx = chunk_x - self.last_player_chunk[0]
+        dz = chunk_z - self.last_player_chunk[1]
+        return dx*dx + dz*dz <= self.render_distance * self.render_distance
+    
     def unload_chunk_immediate(self, chunk_x, chunk_z):
         """Immediately unload a chunk (called from main thread)"""
-        if (chunk_x, chunk_z) in self.chunks:
-            chunk = self.chunks[(chunk_x, chunk_z)]
-            
+        key = chunk_key(chunk_x, chunk_z)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
             # Save chunk data to cache before unloading
             self.save_chunk_to_cache(chunk_x, chunk_z)
+            self._recycle_blocks(chunk)
+            
+            # Drop any mesh still waiting for the batched upload
+            self.renderer.cancel_upload(chunk)
             
             # Clean up GPU resources
             if hasattr(chunk, 'vao') and chunk.vao:
                 chunk.vao.release()
             
             # Remove from dictionaries
-            with self.thread_lock:
-                del self.chunks[(chunk_x, chunk_z)]
-            self.loaded_chunks.discard((chunk_x, chunk_z))
+            del self.chunks[key]
+            self._chunk_index = None
+            self.chunk_states.pop(key, None)
             return True
         return False
     
+    def _recycle_blocks(self, chunk):
+        """Return an unloaded chunk's block array to the pool (its data is already cached)"""
+        with self.meshing_lock:
+            if (chunk.chunk_x, chunk.chunk_z) in self.meshing_chunks:
+                return  # A mesh worker is still reading it
+            blocks = chunk.blocks
+            chunk.blocks = None  # Queued mesh requests for this chunk are skipped
+        self._pool_blocks(blocks)
+    
+    def _pool_blocks(self, blocks):
+        """Keep a no longer used block array for reuse by cache loads"""
+        if blocks is not None and blocks.shape == CHUNK_SHAPE and blocks.flags.c_contiguous:
+            self.chunk_pool.append(blocks)
+    
+    def _discard_result(self, result):
+        """Throw away a loaded/generated chunk that is no longer wanted, keeping its block array"""
+        if result['type'] == 'generated':
+            self._pool_blocks(result['blocks'])
+        else:
+            self._recycle_blocks(result['chunk'])
+    
     def update(self, player_pos):
         """Update chunk loading/unloading based on player position"""
-        # Update player position for mesh priority calculation
-        old_position = self.player_position
-        self.player_position = player_pos
-        
         current_chunk = self.get_player_chunk(player_pos)
+        self._player_cx, self._player_cz = current_chunk
         
         # Process any completed chunks first (increased limit for faster updates)
         loaded, unloaded = self.process_completed_chunks()
@@ -409,24 +733,25 @@ class ThreadedChunkManager:
                     self.clear_distant_mesh_requests()
             
             self.last_player_chunk = current_chunk
+            self._reprioritize_loads()
             
             # Get chunks that should be loaded
-            chunks_to_load = self.get_chunks_in_range(current_chunk[0], current_chunk[1])
+            keys_in_range = self.get_chunk_keys_in_range(current_chunk[0], current_chunk[1])
             
             # Request loading of new chunks
             load_requests = 0
-            for chunk_x, chunk_z in chunks_to_load:
-                if self.request_chunk_load(chunk_x, chunk_z):
+            for key in keys_in_range - self.chunk_states.keys():
+                if self.request_chunk_load(*key_to_chunk(key)):
                     load_requests += 1
             
             # Request unloading of chunks that are too far away
             unload_requests = 0
-            for chunk_coords in list(self.loaded_chunks):
-                if chunk_coords not in chunks_to_load:
-                    if self.request_chunk_unload(chunk_coords[0], chunk_coords[1]):
-                        unload_requests += 1
+            # (only READY chunks are - pending ones out of range were dropped above)
+            for key in self.chunk_states.keys() - keys_in_range:
+                if self.request_chunk_unload(*key_to_chunk(key)):
+                    unload_requests += 1
             
-            if load_requests > 0 or unload_requests > 0:
+            if self.debug_logging and (load_requests > 0 or unload_requests > 0):
                 print(f"Player moved to chunk {current_chunk}. "
                       f"Load requests: {load_requests}, Unload requests: {unload_requests}, "
                       f"Total chunks: {len(self.chunks)}")
@@ -435,8 +760,7 @@ class ThreadedChunkManager:
     
     def get_chunk(self, chunk_x, chunk_z):
         """Get a chunk at the given coordinates, or None if not loaded"""
-        with self.thread_lock:
-            return self.chunks.get((chunk_x, chunk_z))
+        return self.chunks.get(chunk_key(chunk_x, chunk_z))
     
     def get_block_at(self, world_x, world_y, world_z):
         """Get block type at world coordinates"""
@@ -444,7 +768,6 @@ class ThreadedChunkManager:
         chunk = self.get_chunk(chunk_x, chunk_z)
         
         if chunk:
-            from world.modern_chunk import CHUNK_SIZE
             # Convert world coordinates to local chunk coordinates
             local_x = int(world_x - chunk_x * CHUNK_SIZE)
             local_z = int(world_z - chunk_z * CHUNK_SIZE)
@@ -458,7 +781,6 @@ class ThreadedChunkManager:
         chunk = self.get_chunk(chunk_x, chunk_z)
         
         if chunk:
-            from world.modern_chunk import CHUNK_SIZE
             # Convert world coordinates to local chunk coordinates
             local_x = int(world_x - chunk_x * CHUNK_SIZE)
             local_z = int(world_z - chunk_z * CHUNK_SIZE)
@@ -467,31 +789,84 @@ class ThreadedChunkManager:
         
         return False
     
+    def _get_chunk_index(self):
+        """(items, chunk_xs, chunk_zs) snapshot of self.chunks, items being (coords, chunk) pairs"""
+        if self._chunk_index is None:
+            # Rebuilt only when chunks are added or removed, not every frame
+            items = [((chunk.chunk_x, chunk.chunk_z), chunk) for chunk in self.chunks.values()]
+            coords = np.array([c for c, _ in items], dtype=np.int64).reshape(-1, 2)
+            self._chunk_index = (items, coords[:, 0], coords[:, 1])
+        return self._chunk_index
+    
     def render_chunks(self, view_matrix=None, proj_matrix=None, camera_pos=None):
         """Render all loaded chunks with optional frustum and occlusion culling"""
-        with self.thread_lock:
-            chunks_to_render = list(self.chunks.items())
+        index = self._get_chunk_index()
+        
+        # Culling only depends on the chunk set, the camera and the culling settings,
+        # so a static camera reuses last frame's result
+        cache_key = (self.last_player_chunk, self.render_distance,
+                     self.enable_frustum_culling, self.enable_occlusion_culling, self.occlusion_conservative,
+                     view_matrix, proj_matrix, camera_pos)
+        cached = self._render_cache
+        if cached is not None and cached[0] is index and cached[1] == cache_key:
+            chunks_to_render, total_chunks, frustum_culled, occlusion_culled = cached[2]
+        else:
+            culled = self._cull_chunks(index, view_matrix, proj_matrix, camera_pos)
+            chunks_to_render, total_chunks, frustum_culled, occlusion_culled = culled
+            # Keep copies - the caller may reuse and mutate its matrix/vector objects
+            cache_key = cache_key[:5] + (
+                glm.mat4(view_matrix) if view_matrix is not None else None,
+                glm.mat4(proj_matrix) if proj_matrix is not None else None,
+                glm.vec3(camera_pos) if camera_pos is not None else None,
+            )
+            self._render_cache = (index, cache_key, culled)
+        
+        # Render the remaining visible chunks in a single pass - chunk meshes are
+        # all opaque (water is drawn separately by the renderer's water surface)
+        for chunk_coords, chunk in chunks_to_render:
+            chunk.render()
+        rendered_chunks = len(chunks_to_render)
+        
+        return rendered_chunks, total_chunks, frustum_culled, occlusion_culled
+    
+    def _cull_chunks(self, index, view_matrix, proj_matrix, camera_pos):
+        """Returns (visible (coords, chunk) pairs, total chunks, frustum culled, occlusion culled)"""
+        items, chunk_xs, chunk_zs = index
+        total_chunks = len(items)
         
-        total_chunks = len(chunks_to_render)
         frustum_culled = 0
         occlusion_culled = 0
-        rendered_chunks = 0
+        
+        # Chunks waiting to be unloaded are dropped with one vectorized distance test
+        keep = None
+        if self.last_player_chunk is not None:
+            dx = chunk_xs - self.last_player_chunk[0]
+            dz = chunk_zs - self.last_player_chunk[1]
+            r = self.render_distance
+            keep = dx * dx + dz * dz <= r * r
         
         # Apply frustum culling first if enabled
         if self.enable_frustum_culling and view_matrix is not None and proj_matrix is not None:
-            view_proj_matrix = proj_matrix * view_matrix
-            self.frustum.extract_planes(view_proj_matrix)
-            
-            # Filter chunks using frustum culling
-            frustum_visible_chunks = []
-            for chunk_coords, chunk in chunks_to_render:
-                chunk_x, chunk_z = chunk_coords
-                if self.frustum.is_chunk_visible(chunk_x, chunk_z):
-                    frustum_visible_chunks.append((chunk_coords, chunk))
-                else:
-                    frustum_culled += 1
+            # Planes only change when the camera does (e.g. not while standing still)
+            last = self._frustum_matrices
+            if last is None or view_matrix != last[0] or proj_matrix != last[1]:
+                view_proj_matrix = proj_matrix * view_matrix
+                self.frustum.extract_planes(view_proj_matrix)
+                self._frustum_matrices = (glm.mat4(view_matrix), glm.mat4(proj_matrix))
             
-            chunks_to_render = frustum_visible_chunks
+            # Test every chunk's bounding box against the planes at once
+            visible = self.frustum.chunks_visible_mask(chunk_xs, chunk_zs)
+            if keep is None:
+                frustum_culled = int(np.count_nonzero(~visible))
+                keep = visible
+            else:
+                frustum_culled = int(np.count_nonzero(keep & ~visible))
+                keep &= visible
+        
+        if keep is None:
+            chunks_to_render = items
+        else:
+            chunks_to_render = [items[i] for i in np.flatnonzero(keep).tolist()]
         
         # Apply occlusion culling if enabled and camera position is available
         if self.enable_occlusion_culling and camera_pos is not None:
@@ -500,17 +875,7 @@ class ThreadedChunkManager:
             occlusion_culled = len(chunks_to_render) - len(occlusion_visible_chunks)
             chunks_to_render = occlusion_visible_chunks
         
-        # Render the remaining visible chunks (solid blocks first)
-        for chunk_coords, chunk in chunks_to_render:
-            chunk.render()
-            rendered_chunks += 1
-        
-        # Then render transparent blocks (water, leaves) with proper blending
-        for chunk_coords, chunk in chunks_to_render:
-            if hasattr(chunk, 'render_transparent'):
-                chunk.render_transparent()
-        
-        return rendered_chunks, total_chunks, frustum_culled, occlusion_culled
+        return chunks_to_render, total_chunks, frustum_culled, occlusion_culled
     
     def cleanup(self):
         """Clean up all chunks and resources"""
@@ -518,18 +883,24 @@ class ThreadedChunkManager:
         
         # Stop background thread
         self.should_stop = True
+        self.work_event.set()
         if self.loading_thread and self.loading_thread.is_alive():
             self.loading_thread.join(timeout=2.0)
+        with self.mesh_build_ready:
+            self.mesh_build_ready.notify_all()
+        for thread in self.mesh_threads:
+            thread.join(timeout=2.0)
+        self.generation_pool.shutdown(wait=False, cancel_futures=True)
         
         # Clean up all chunks
-        with self.thread_lock:
-            for chunk in self.chunks.values():
-                if hasattr(chunk, 'vao') and chunk.vao:
-                    chunk.vao.release()
-            
-            chunk_count = len(self.chunks)
-            self.chunks.clear()
-            self.loaded_chunks.clear()
+        for chunk in self.chunks.values():
+            if hasattr(chunk, 'vao') and chunk.vao:
+                chunk.vao.release()
+        
+        chunk_count = len(self.chunks)
+        self.chunks.clear()
+        self._chunk_index = None
+        self.chunk_states.clear()
         
         print(f"Cleaned up {chunk_count} chunks")
     
@@ -543,18 +914,17 @@ class ThreadedChunkManager:
     
     def get_chunk_info(self):
         """Get information about loaded chunks for debugging"""
-        with self.thread_lock:
-            return {
-                'loaded_chunks': len(self.chunks),
-                'pending_chunks': len(self.loaded_chunks) - len(self.chunks),
-                'cached_chunks': len(self.chunk_cache),
-                'explored_chunks': len(self.explored_chunks),
-                'queue_size': self.chunk_queue.qsize(),
-                'completed_queue_size': self.completed_chunks.qsize(),
-                'frustum_culling': self.enable_frustum_culling,
-                'occlusion_culling': self.enable_occlusion_culling,
-                'occlusion_cache_size': len(self.occlusion_culler.visibility_cache) if self.occlusion_culler else 0
-            }
+        return {
+            'loaded_chunks': len(self.chunks),
+            'pending_chunks': len(self.chunk_states) - len(self.chunks),
+            'cached_chunks': len(self.chunk_cache),
+            'explored_chunks': len(self.explored_chunks),
+            'queue_size': len(self.chunk_queue) + len(self.load_heap),
+            'completed_queue_size': len(self.completed_chunks),
+            'frustum_culling': self.enable_frustum_culling,
+            'occlusion_culling': self.enable_occlusion_culling,
+            'occlusion_cache_size': len(self.occlusion_culler.visibility_cache) if self.occlusion_culler else 0
+        }
     
     def toggle_frustum_culling(self):
         """Toggle frustum culling on/off"""
@@ -571,9 +941,9 @@ class ThreadedChunkManager:
         return self.enable_occlusion_culling
     
     def toggle_occlusion_conservative_mode(self):
-        """Toggle conservative occlusion culling mode"""
-        if self.occlusion_culler:
-            # Check current threshold to determine mode
-            is_conservative = self.occlusion_culler.occlusion_threshold >= 0.99
-            self.occlusion_culler.set_conservative_mode(not is_conservative)
-        return not is_conservative
+        """Toggle conservative occlusion culling mode, returns the new mode"""
+        if self.occlusion_culler is None:
+            return False
+        self.occlusion_conservative = not self.occlusion_conservative
+        self.occlusion_culler.set_conservative_mode(self.occlusion_conservative)
+        return self.occlusion_conservative